@@ -221,6 +221,7 @@ def _check_credential(spec, cred_name: str, label: str) -> None:
                         value,
                         health_check_endpoint=spec.health_check_endpoint,
                         health_check_method=spec.health_check_method,
+                        health_check_ttl_seconds=spec.health_check_ttl_seconds,
                     )
                     if not result.valid:
                         entry = f"  {spec.env_var} for {label} — {result.message}"
@@ -30,6 +30,8 @@
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +69,7 @@ def _patched_console_init(self, *args, **kwargs):
 
 from aden_tools.credentials import CredentialError, CredentialStoreAdapter  # noqa: E402
 from aden_tools.tools import register_all_tools  # noqa: E402
+from aden_tools.tools.google_docs_tool import close_http_client  # noqa: E402
 
 credentials = CredentialStoreAdapter.default()
 
@@ -78,7 +81,17 @@ def _patched_console_init(self, *args, **kwargs):
     # Non-fatal - tools will validate their own credentials when called
     logger.warning(str(e))
 
-mcp = FastMCP("tools")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Release pooled HTTP clients held by tools when the server stops."""
+    try:
+        yield {}
+    finally:
+        await close_http_client()
+
+
+mcp = FastMCP("tools", lifespan=lifespan)
 
 # Register all tools with the MCP server, passing credential store
 tools = register_all_tools(mcp, credentials=credentials)
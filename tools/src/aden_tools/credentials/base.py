@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -25,8 +26,10 @@ class CredentialSpec:
     env_var: str
     """Environment variable name (e.g., 'BRAVE_SEARCH_API_KEY')"""
 
-    tools: list[str] = field(default_factory=list)
-    """Tool names that require this credential (e.g., ['web_search'])"""
+    tools: tuple[str, ...] = ()
+    """Tool names that require this credential (e.g., ('web_search',)).
+
+    Any iterable is accepted and stored as a tuple of interned strings."""
 
     node_types: list[str] = field(default_factory=list)
     """Node types that require this credential (e.g., ['event_loop'])"""
@@ -63,6 +66,9 @@ class CredentialSpec:
     health_check_method: str = "GET"
     """HTTP method for health check"""
 
+    health_check_ttl_seconds: int = 30
+    """How long a health check result is reused for the same credential (0 disables)"""
+
     # Credential store mapping
     credential_id: str = ""
     """Credential store ID (e.g., 'hubspot' for the CredentialStore)"""
@@ -73,6 +79,10 @@ class CredentialSpec:
     credential_group: str = ""
     """Group name for credentials that must be configured together (e.g., 'google_custom_search')"""
 
+    def __post_init__(self) -> None:
+        # Specs are static lookup tables: store tool names compactly and immutably
+        self.tools = tuple(sys.intern(name) for name in self.tools)
+
 
 class CredentialError(Exception):
     """Raised when required credentials are missing."""
@@ -13,10 +13,12 @@
             "google_docs_create_document",
             "google_docs_get_document",
             "google_docs_insert_text",
+            "google_docs_insert_texts",
             "google_docs_replace_all_text",
             "google_docs_insert_image",
             "google_docs_format_text",
             "google_docs_batch_update",
+            "google_docs_multi_apply",
             "google_docs_create_list",
             "google_docs_add_comment",
             "google_docs_list_comments",
@@ -42,7 +44,8 @@
    - https://www.googleapis.com/auth/drive.file
    - https://www.googleapis.com/auth/drive (for export/comments)""",
         # Health check configuration
-        health_check_endpoint="https://docs.googleapis.com/v1/documents/1",
+        # documents/1 does not exist: a 404 means the token passed authentication
+        health_check_endpoint="https://docs.googleapis.com/v1/documents/1?fields=documentId",
         health_check_method="GET",
         # Credential store mapping
         credential_id="google_docs",
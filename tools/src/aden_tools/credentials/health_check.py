@@ -8,11 +8,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Any, Protocol
 
 import httpx
 
+# (credential name, sha256 of value, endpoint) -> (monotonic expiry, result)
+_HEALTH_CACHE: dict[tuple[str, str, str], tuple[float, HealthCheckResult]] = {}
+_HEALTH_CACHE_LOCK = threading.Lock()
+_HEALTH_CACHE_MAX_ENTRIES = 256
+
 
 @dataclass
 class HealthCheckResult:
@@ -165,17 +173,22 @@ def check(self, api_key: str) -> HealthCheckResult:
 class OAuthBearerHealthChecker:
     """Generic health checker for OAuth2 Bearer token credentials.
 
-    Validates by making a GET request with ``Authorization: Bearer <token>``
-    to the given endpoint.  Reused for Google Gmail, Google Calendar, and as
-    the automatic fallback for any credential spec that defines a
-    ``health_check_endpoint`` but has no dedicated checker.
+    Validates by making a GET (or HEAD) request with
+    ``Authorization: Bearer <token>`` to the given endpoint.  Reused for Google
+    Gmail, Google Calendar, and as the automatic fallback for any credential
+    spec that defines a ``health_check_endpoint`` but has no dedicated checker.
     """
 
     TIMEOUT = 10.0
 
-    def __init__(self, endpoint: str, service_name: str = "Service"):
+    AUTHENTICATED_STATUSES: frozenset[int] = frozenset()
+    """Non-200 statuses that still prove the token was accepted (e.g. 404 for a
+    probe of a resource that does not exist)."""
+
+    def __init__(self, endpoint: str, service_name: str = "Service", method: str = "GET"):
         self.endpoint = endpoint
         self.service_name = service_name
+        self.method = method.upper()
 
     def _extract_identity(self, data: dict) -> dict[str, str]:
         """Override to extract identity fields from a successful response."""
@@ -184,7 +197,9 @@ def _extract_identity(self, data: dict) -> dict[str, str]:
     def check(self, access_token: str) -> HealthCheckResult:
         try:
             with httpx.Client(timeout=self.TIMEOUT) as client:
-                response = client.get(
+                # HEAD returns headers only; anything else falls back to GET
+                send = client.head if self.method == "HEAD" else client.get
+                response = send(
                     self.endpoint,
                     headers={
                         "Authorization": f"Bearer {access_token}",
@@ -194,16 +209,24 @@ def check(self, access_token: str) -> HealthCheckResult:
 
                 if response.status_code == 200:
                     identity: dict[str, str] = {}
-                    try:
-                        data = response.json()
-                        identity = self._extract_identity(data)
-                    except Exception:
-                        pass  # Identity extraction is best-effort
+                    if self.method != "HEAD":
+                        try:
+                            data = response.json()
+                            identity = self._extract_identity(data)
+                        except Exception:
+                            pass  # Identity extraction is best-effort
                     return HealthCheckResult(
                         valid=True,
                         message=f"{self.service_name} credentials valid",
                         details={"identity": identity} if identity else {},
                     )
+                elif response.status_code in self.AUTHENTICATED_STATUSES:
+                    # Auth passed; the body (an error about the probe target) is not needed
+                    return HealthCheckResult(
+                        valid=True,
+                        message=f"{self.service_name} credentials valid",
+                        details={"status_code": response.status_code},
+                    )
                 elif response.status_code == 401:
                     return HealthCheckResult(
                         valid=False,
@@ -726,6 +749,23 @@ def check(self, api_key: str) -> HealthCheckResult:
             )
 
 
+class GoogleDocsHealthChecker(OAuthBearerHealthChecker):
+    """Health checker for Google Docs OAuth tokens.
+
+    Probes a document ID that does not exist: Google authenticates the token
+    before looking the document up, so a 404 proves the token works. The
+    ``fields`` mask keeps the response minimal.
+    """
+
+    AUTHENTICATED_STATUSES = frozenset({404})
+
+    def __init__(self):
+        super().__init__(
+            endpoint="https://docs.googleapis.com/v1/documents/1?fields=documentId",
+            service_name="Google Docs",
+        )
+
+
 class GoogleGmailHealthChecker(OAuthBearerHealthChecker):
     """Health checker for Google Gmail OAuth tokens."""
 
@@ -747,6 +787,7 @@ def _extract_identity(self, data: dict) -> dict[str, str]:
     "brave_search": BraveSearchHealthChecker(),
     "google_calendar_oauth": GoogleCalendarHealthChecker(),
     "google": GoogleGmailHealthChecker(),
+    "google_docs": GoogleDocsHealthChecker(),
     "slack": SlackHealthChecker(),
     "google_search": GoogleSearchHealthChecker(),
     "google_maps": GoogleMapsHealthChecker(),
@@ -773,6 +814,9 @@ def check_credential_health(
               checker is registered. Used automatically by
               ``validate_agent_credentials`` from the credential spec.
             - health_check_method: HTTP method for fallback (default GET).
+            - health_check_ttl_seconds: Reuse a result for the same credential
+              and endpoint for this many seconds (default 0, no caching).
+              Results from timeouts and connection errors are never cached.
 
     Returns:
         HealthCheckResult with validation status
@@ -784,6 +828,40 @@ def check_credential_health(
         ... else:
         ...     print(f"Invalid: {result.message}")
     """
+    ttl = kwargs.get("health_check_ttl_seconds") or 0
+    if ttl <= 0:
+        return _run_health_check(credential_name, credential_value, **kwargs)
+
+    key = (
+        credential_name,
+        hashlib.sha256(credential_value.encode("utf-8")).hexdigest(),
+        kwargs.get("health_check_endpoint") or "",
+    )
+    now = time.monotonic()
+    with _HEALTH_CACHE_LOCK:
+        cached = _HEALTH_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    result = _run_health_check(credential_name, credential_value, **kwargs)
+    # Transient failures (timeouts, connection errors) say nothing about the credential
+    if "error" not in result.details:
+        with _HEALTH_CACHE_LOCK:
+            if len(_HEALTH_CACHE) >= _HEALTH_CACHE_MAX_ENTRIES:
+                for stale in [k for k, (expiry, _) in _HEALTH_CACHE.items() if expiry <= now]:
+                    del _HEALTH_CACHE[stale]
+                if len(_HEALTH_CACHE) >= _HEALTH_CACHE_MAX_ENTRIES:
+                    _HEALTH_CACHE.clear()
+            _HEALTH_CACHE[key] = (now + ttl, result)
+    return result
+
+
+def _run_health_check(
+    credential_name: str,
+    credential_value: str,
+    **kwargs: Any,
+) -> HealthCheckResult:
+    """Dispatch to the registered (or fallback) checker without caching."""
     checker = HEALTH_CHECKERS.get(credential_name)
 
     if checker is None:
@@ -793,6 +871,7 @@ def check_credential_health(
             checker = OAuthBearerHealthChecker(
                 endpoint=endpoint,
                 service_name=credential_name.replace("_", " ").title(),
+                method=kwargs.get("health_check_method") or "GET",
             )
         else:
             return HealthCheckResult(
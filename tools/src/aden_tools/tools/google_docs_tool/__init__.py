@@ -4,6 +4,6 @@
 Supports OAuth2 authentication via access tokens.
 """
 
-from .google_docs_tool import register_tools
+from .google_docs_tool import close_http_client, register_tools
 
-__all__ = ["register_tools"]
+__all__ = ["close_http_client", "register_tools"]
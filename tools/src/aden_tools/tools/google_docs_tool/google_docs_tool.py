@@ -14,17 +14,47 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import binascii
+import functools
 import json
 import os
+import random
 import re
 import time
-from typing import TYPE_CHECKING, Any
+import types
+from collections import OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 from urllib.parse import urlparse
 
 import httpx
 from fastmcp import FastMCP
 
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 needs the optional ``h2`` package (httpx[http2])
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catching the stdlib error handle both parsers
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+    _json_dumps: Callable[[Any], bytes] = orjson.dumps
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -32,6 +62,10 @@
 GOOGLE_DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 GOOGLE_OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"
 
+# URL prefixes that per-document URLs are built from
+_DOCUMENTS_URL = GOOGLE_DOCS_API_BASE + "/documents/"
+_DRIVE_FILES_URL = GOOGLE_DRIVE_API_BASE + "/files/"
+
 # Allowed URL schemes for image insertion
 ALLOWED_IMAGE_SCHEMES = {"https", "http"}
 # Regex pattern for valid URLs
@@ -45,6 +79,145 @@
     re.IGNORECASE,
 )
 
+# Export formats supported by the Drive export endpoint
+_MIME_TYPES = types.MappingProxyType(
+    {
+        "pdf": "application/pdf",
+        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "txt": "text/plain",
+        "html": "text/html",
+        "odt": "application/vnd.oasis.opendocument.text",
+        "rtf": "application/rtf",
+        "epub": "application/epub+zip",
+    }
+)
+
+# List types accepted by google_docs_create_list
+_BULLET_PRESETS = types.MappingProxyType(
+    {
+        "bullet": "BULLET_DISC_CIRCLE_SQUARE",
+        "numbered": "NUMBERED_DECIMAL_ALPHA_ROMAN",
+    }
+)
+
+# updateTextStyle field names, one bit each in format_text's field mask
+_TEXT_STYLE_FIELDS = ("bold", "italic", "underline", "fontSize", "foregroundColor")
+# Field mask -> comma-joined "fields" value, for every combination of the above
+_FIELDS_TABLE = tuple(
+    ",".join(name for bit, name in enumerate(_TEXT_STYLE_FIELDS) if mask >> bit & 1)
+    for mask in range(1 << len(_TEXT_STYLE_FIELDS))
+)
+
+# Shared by every tool when no token is available; treat as read-only
+_NO_CREDS_ERROR: dict[str, str] = {
+    "error": "Google Docs credentials not configured",
+    "help": (
+        "Set GOOGLE_DOCS_ACCESS_TOKEN environment variable "
+        "or configure via credential store. "
+        "Get credentials at: https://console.cloud.google.com/apis/credentials"
+    ),
+}
+
+_UNAUTHORIZED_ERROR = "Invalid or expired Google access token"
+
+# Default timeouts for the shared client; batch updates and exports get longer reads
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_LONG_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+# Tail lookups return a few hundred bytes, so fail fast
+_TAIL_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# How long a cached document end index is trusted before it is fetched again
+_END_INDEX_TTL_SECONDS = 10.0
+
+# Documents whose URLs a client remembers before starting over
+_URL_CACHE_SIZE = 256
+
+# Clients (and their per-document caches) kept per access token by register_tools
+_CLIENT_CACHE_SIZE = 8
+
+# Access tokens without a known lifetime are reused for at most this long
+_TOKEN_CACHE_TTL_SECONDS = 30 * 60
+# The credential store refreshes its tokens itself, so they are read again soon
+_STORE_TOKEN_LIFETIME_SECONDS = 60
+# Cached tokens are refreshed this long before they expire
+_TOKEN_REFRESH_MARGIN_SECONDS = 30
+
+# Transient failures retried with backoff, and how hard to try. Writes may have
+# been applied when a server error comes back, so only reads retry those.
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_RETRYABLE_WRITE_STATUS_CODES = frozenset({429, 503})
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF_SECONDS = 30.0
+
+# Minimum spacing between batchUpdate calls for the same document
+_BATCH_UPDATE_INTERVAL_SECONDS = 0.2
+
+# Documents updated at once by google_docs_multi_apply (keeps clear of per-user rate limits)
+_MULTI_APPLY_CONCURRENCY = 16
+
+# requests_json payloads larger than this are parsed in a worker thread
+_THREADED_PARSE_THRESHOLD = 256_000
+
+# Read size for streamed exports (a multiple of 3 so base64 chunks join cleanly)
+_EXPORT_CHUNK_SIZE = 3 * 64 * 1024
+
+# Window in which single-request updates to the same document are coalesced
+BATCH_WINDOW_MS = 20
+
+# Shared async HTTP client, created lazily and reused across all tool calls
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use.
+
+    Reusing one pooled client keeps connections to the Google APIs warm, so
+    consecutive tool calls skip the TCP/TLS handshake. HTTP/2 is enabled when
+    the ``h2`` package is installed.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=_DEFAULT_TIMEOUT,
+        )
+    return _CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it was created.
+
+    Call this from the server's shutdown path (see ``mcp_server.py``); a later
+    tool call simply opens a new client.
+    """
+    global _CLIENT
+    if _CLIENT is not None:
+        client, _CLIENT = _CLIENT, None
+        await client.aclose()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a failed request.
+
+    Honors a ``Retry-After`` header (seconds or HTTP date) when the server sends
+    one, otherwise backs off exponentially with jitter. Capped at
+    ``_MAX_BACKOFF_SECONDS`` either way.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), _MAX_BACKOFF_SECONDS)
+    return min(2**attempt + random.random() * 0.25, _MAX_BACKOFF_SECONDS)
+
 
 def _validate_image_uri(uri: str) -> dict[str, str] | None:
     """Validate that an image URI is well-formed and uses a secure scheme.
@@ -81,25 +254,42 @@ def _validate_image_uri(uri: str) -> dict[str, str] | None:
     return None
 
 
-def _get_document_end_index(doc: dict[str, Any]) -> int:
-    """Extract the end index from a document for appending text.
+def _utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit Google Docs indexes use."""
+    return len(text.encode("utf-16-le")) // 2
 
-    Args:
-        doc: The document response from the API
 
-    Returns:
-        The index to insert at for appending to end of document
+def _token_lifetime(token: str) -> float:
+    """Seconds an access token can be reused for.
+
+    Uses the ``exp`` claim when the token is a JWT, otherwise a conservative
+    default (Google OAuth access tokens are opaque and last an hour).
     """
-    body = doc.get("body", {})
-    content = body.get("content", [])
-    if content:
-        last_element = content[-1]
-        end_index = last_element.get("endIndex", 1)
-        return end_index - 1  # Insert before the final newline
-    return 1
+    parts = token.split(".")
+    if len(parts) == 3:
+        payload = parts[1] + "=" * (-len(parts[1]) % 4)
+        try:
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        except (ValueError, AttributeError):
+            exp = None
+        if isinstance(exp, int | float):
+            return exp - time.time()
+    return _TOKEN_CACHE_TTL_SECONDS
+
+
+@functools.lru_cache(maxsize=4)
+def _load_service_account_json(service_account_json: str) -> dict[str, Any] | None:
+    """Parse service account JSON once per distinct value (callers must not mutate it)."""
+    try:
+        sa_data = json.loads(service_account_json)
+    except json.JSONDecodeError:
+        return None
+    return sa_data if isinstance(sa_data, dict) else None
 
 
-def _create_service_account_token(service_account_json: str) -> str | None:
+def _create_service_account_token(
+    service_account_json: str,
+) -> tuple[str | None, float | None]:
     """Create an access token from a service account JSON using JWT.
 
     This implements the OAuth 2.0 service account flow:
@@ -110,17 +300,17 @@ def _create_service_account_token(service_account_json: str) -> str | None:
         service_account_json: The service account JSON string
 
     Returns:
-        Access token string, or None if token creation failed
+        Tuple of (access token or None if token creation failed, token lifetime
+        in seconds or None if unknown)
     """
-    try:
-        sa_data = json.loads(service_account_json)
-    except json.JSONDecodeError:
-        return None
+    sa_data = _load_service_account_json(service_account_json)
+    if sa_data is None:
+        return None, None
 
     # Check if this is actually a service account
     if sa_data.get("type") != "service_account":
         # Not a service account, check for direct access token
-        return sa_data.get("access_token")
+        return sa_data.get("access_token"), None
 
     # Required fields for service account
     private_key = sa_data.get("private_key")
@@ -128,7 +318,7 @@ def _create_service_account_token(service_account_json: str) -> str | None:
     token_uri = sa_data.get("token_uri", GOOGLE_OAUTH_TOKEN_URL)
 
     if not private_key or not client_email:
-        return None
+        return None, None
 
     # Create JWT header and claims
     now = int(time.time())
@@ -185,37 +375,282 @@ def _b64url_encode(data: bytes) -> str:
 
         if response.status_code == 200:
             token_data = response.json()
-            return token_data.get("access_token")
+            expires_in = token_data.get("expires_in")
+            lifetime = float(expires_in) if isinstance(expires_in, int | float) else None
+            return token_data.get("access_token"), lifetime
 
-        return None
+        return None, None
 
     except ImportError:
         # cryptography not available, cannot sign JWT
         # Fall back to checking for pre-exchanged token
-        return sa_data.get("access_token")
+        return sa_data.get("access_token"), None
     except Exception:
         # Any signing/exchange error
-        return None
+        return None, None
+
+
+class _DocumentUrls(NamedTuple):
+    """API endpoints for one document."""
+
+    document: str
+    batch_update: str
+    comments: str
+    export: str
+
+
+class _DocumentLocks:
+    """One ``asyncio.Lock`` per document, dropped once no task holds or awaits it."""
+
+    def __init__(self) -> None:
+        # document_id -> (lock, number of tasks holding or waiting on it)
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, document_id: str) -> AsyncIterator[None]:
+        """Hold the document's lock for the duration of the ``async with`` block."""
+        lock, users = self._locks.get(document_id, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[document_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[document_id]
+            if users == 1:
+                del self._locks[document_id]
+            else:
+                self._locks[document_id] = (lock, users - 1)
+
+
+class _BatchCoalescer:
+    """Coalesce single-request updates to a document into one batchUpdate call.
+
+    Requests submitted for the same document within ``BATCH_WINDOW_MS`` are
+    sent together, in submission order, and each submitter receives a
+    batchUpdate-shaped response holding only its own reply. The response body
+    is only decoded when at least one submitter in the batch asked for it.
+    Submitters that did not always get the ``{"ok": True, "status": ...}``
+    summary, whatever they were batched with.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, list[dict[str, Any]], bool], Awaitable[tuple[int, dict[str, Any]]]],
+        window_ms: float = BATCH_WINDOW_MS,
+    ):
+        self._send = send
+        self._window = window_ms / 1000
+        self._pending: defaultdict[
+            str, list[tuple[dict[str, Any], bool, asyncio.Future[dict[str, Any]]]]
+        ] = defaultdict(list)
+        self._timers: dict[str, asyncio.Task[None]] = {}
+        self._locks = _DocumentLocks()
+
+    def enqueue(
+        self, document_id: str, request: dict[str, Any], parse_body: bool = True
+    ) -> asyncio.Future[dict[str, Any]]:
+        """Queue a request for the document and return a future for its reply."""
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[document_id].append((request, parse_body, future))
+        if document_id not in self._timers:
+            self._timers[document_id] = asyncio.create_task(self._flush_loop(document_id))
+        return future
+
+    async def flush(self, document_id: str) -> None:
+        """Send any requests queued for the document right away."""
+        timer = self._timers.pop(document_id, None)
+        if timer is not None:
+            timer.cancel()
+        await self._drain(document_id)
+
+    async def _flush_loop(self, document_id: str) -> None:
+        await asyncio.sleep(self._window)
+        self._timers.pop(document_id, None)
+        await self._drain(document_id)
+
+    async def _drain(self, document_id: str) -> None:
+        # The lock keeps batches for one document in submission order
+        async with self._locks.hold(document_id):
+            await self._send_pending(document_id)
+
+    async def _send_pending(self, document_id: str) -> None:
+        batch = self._pending.pop(document_id, [])
+        if not batch:
+            return
+        parse_body = any(wants_body for _, wants_body, _ in batch)
+        try:
+            status, result = await self._send(
+                document_id, [request for request, _, _ in batch], parse_body
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if status == 400 and len(batch) > 1:
+            # batchUpdate is atomic, so nothing was applied. A 400 means some
+            # request was invalid: resend each alone so callers only see errors
+            # caused by their own. Other errors (rate limits, auth, outages)
+            # would hit every resend too, so they go to all callers as is.
+            for request, wants_body, future in batch:
+                try:
+                    _, single = await self._send(document_id, [request], wants_body)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+                if not future.done():
+                    future.set_result(single)
+            return
+
+        replies = result.get("replies", [])
+        for i, (_, wants_body, future) in enumerate(batch):
+            if future.done():
+                continue
+            if "error" in result:
+                future.set_result(result)
+            elif not wants_body:
+                # Same shape as when the request is sent on its own
+                future.set_result({"ok": True, "status": status})
+            else:
+                future.set_result({**result, "replies": replies[i : i + 1]})
 
 
 class _GoogleDocsClient:
     """Internal client wrapping Google Docs API v1 calls."""
 
-    def __init__(self, access_token: str):
-        self._token = access_token
+    # document_id -> earliest monotonic time the next batchUpdate may be sent.
+    # Shared by all clients so per-document spacing holds across tokens.
+    _next_batch_slot: ClassVar[dict[str, float]] = {}
+    # (access token, document_id) -> in-flight full document fetch, shared by
+    # concurrent callers so they wait on one GET instead of each sending their own
+    _inflight: ClassVar[dict[tuple[str, str], asyncio.Task[dict[str, Any]]]] = {}
+
+    def __init__(
+        self,
+        access_token: str,
+        renew_token: Callable[[str], str | None] | None = None,
+    ):
+        self.set_token(access_token)
+        # Called with a token the API rejected; returns a fresh one, if any
+        self._renew_token = renew_token
+        # document_id -> (expiry, append index), refreshed on demand by insert_text
+        self._doc_cache: dict[str, tuple[float, int]] = {}
+        # Held while reading or changing a document's cached append index, so a
+        # slow lookup cannot overwrite what other updates did in the meantime
+        self._index_locks = _DocumentLocks()
+        self._batcher = _BatchCoalescer(self._post_batch_update)
+        self._urls: dict[str, _DocumentUrls] = {}
 
     @property
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
+    def _http(self) -> httpx.AsyncClient:
+        return _get_http()
+
+    def _urls_for(self, document_id: str) -> _DocumentUrls:
+        """Return the endpoints for a document, building them on first use."""
+        urls = self._urls.get(document_id)
+        if urls is None:
+            if len(self._urls) >= _URL_CACHE_SIZE:
+                self._urls.clear()
+            document_url = _DOCUMENTS_URL + document_id
+            file_url = _DRIVE_FILES_URL + document_id
+            urls = self._urls[document_id] = _DocumentUrls(
+                document=document_url,
+                batch_update=document_url + ":batchUpdate",
+                comments=file_url + "/comments",
+                export=file_url + "/export",
+            )
+        return urls
+
+    def set_token(self, access_token: str) -> None:
+        """Set the access token and rebuild the request headers once."""
+        self._token = access_token
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle common HTTP error codes."""
+    def _refresh_token(self, rejected: str) -> bool:
+        """Switch to a fresh token after ``rejected`` got a 401.
+
+        Returns whether the request is worth sending again.
+        """
+        if self._token != rejected:
+            # A concurrent request already switched tokens
+            return True
+        if self._renew_token is None:
+            return False
+        token = self._renew_token(rejected)
+        if not token or token == rejected:
+            return False
+        self.set_token(token)
+        return True
+
+    async def _request_with_retry(
+        self,
+        send: Callable[..., Awaitable[httpx.Response]],
+        url: str,
+        *,
+        idempotent: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Call ``send(url, **kwargs)``, retrying rate limits and transient server errors.
+
+        Non-idempotent requests are only retried on 429 and 503, which Google
+        returns before doing any work. A 401 is sent once more with a fresh
+        token when one can be had.
+        """
+        retry_on = _RETRYABLE_STATUS_CODES if idempotent else _RETRYABLE_WRITE_STATUS_CODES
+        token = self._token
+        response = await self._send_with_backoff(send, url, retry_on, **kwargs)
+        if response.status_code == 401 and self._refresh_token(token):
+            kwargs["headers"] = self._headers
+            response = await self._send_with_backoff(send, url, retry_on, **kwargs)
+        return response
+
+    async def _send_with_backoff(
+        self,
+        send: Callable[..., Awaitable[httpx.Response]],
+        url: str,
+        retry_on: frozenset[int],
+        **kwargs: Any,
+    ) -> httpx.Response:
+        for attempt in range(_MAX_ATTEMPTS - 1):
+            response = await send(url, **kwargs)
+            if response.status_code not in retry_on:
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt))
+        return await send(url, **kwargs)
+
+    @classmethod
+    async def _wait_for_batch_slot(cls, document_id: str) -> None:
+        """Space out batchUpdate calls for one document by at least 200ms."""
+        now = time.monotonic()
+        slot = max(now, cls._next_batch_slot.get(document_id, 0.0))
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        cls._next_batch_slot[document_id] = slot + _BATCH_UPDATE_INTERVAL_SECONDS
+        if len(cls._next_batch_slot) > 1024:
+            for doc, next_slot in list(cls._next_batch_slot.items()):
+                if next_slot < now:
+                    del cls._next_batch_slot[doc]
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def _handle_response(self, response: httpx.Response, parse_body: bool = True) -> dict[str, Any]:
+        """Handle common HTTP error codes.
+
+        With ``parse_body=False`` a successful response is not decoded and
+        ``{"ok": True, "status": <code>}`` is returned instead.
+        """
         if response.status_code == 401:
-            return {"error": "Invalid or expired Google access token"}
+            return {"error": _UNAUTHORIZED_ERROR}
         if response.status_code == 403:
             return {
                 "error": "Insufficient permissions. Check your Google API scopes. "
@@ -227,43 +662,233 @@ def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
             return {"error": "Google API rate limit exceeded. Try again later."}
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = _json_loads(response.content)
                 detail = error_data.get("error", {}).get("message", response.text)
             except Exception:
                 detail = response.text
             return {"error": f"Google Docs API error (HTTP {response.status_code}): {detail}"}
-        return response.json()
+        if not parse_body:
+            return {"ok": True, "status": response.status_code}
+        return _json_loads(response.content)
 
-    def create_document(self, title: str) -> dict[str, Any]:
+    async def create_document(self, title: str) -> dict[str, Any]:
         """Create a new blank document with a specified title."""
-        response = httpx.post(
+        response = await self._request_with_retry(
+            self._http.post,
             f"{GOOGLE_DOCS_API_BASE}/documents",
+            idempotent=False,
             headers=self._headers,
-            json={"title": title},
-            timeout=30.0,
+            content=_json_dumps({"title": title}),
         )
         return self._handle_response(response)
 
-    def get_document(self, document_id: str) -> dict[str, Any]:
-        """Retrieve the full structural content, metadata, and elements of a document."""
-        response = httpx.get(
-            f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}",
+    async def get_document(self, document_id: str) -> dict[str, Any]:
+        """Retrieve the full structural content, metadata, and elements of a document.
+
+        Concurrent calls for the same document and token share one request and
+        receive the same result dict, which callers must not modify.
+        """
+        key = (self._token, document_id)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_document(document_id))
+            self._inflight[key] = task
+
+            def _forget(done: asyncio.Task[dict[str, Any]]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_forget)
+        # Shielded so one caller giving up does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_document(self, document_id: str) -> dict[str, Any]:
+        """GET the full document (the request shared by get_document callers)."""
+        response = await self._request_with_retry(
+            self._http.get,
+            self._urls_for(document_id).document,
+            idempotent=True,
             headers=self._headers,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def batch_update(self, document_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
-        """Execute multiple requests in a single atomic operation."""
-        response = httpx.post(
-            f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}:batchUpdate",
+    async def get_document_tail(self, document_id: str) -> int | dict[str, Any]:
+        """Return the ``endIndex`` of the document body, or an error dict.
+
+        Only the ``endIndex`` of each body element is requested, so the
+        response stays tiny regardless of document size.
+        """
+        response = await self._request_with_retry(
+            self._http.get,
+            self._urls_for(document_id).document,
+            idempotent=True,
             headers=self._headers,
-            json={"requests": requests},
-            timeout=60.0,
+            params={"fields": "body(content(endIndex))"},
+            timeout=_TAIL_TIMEOUT,
         )
-        return self._handle_response(response)
+        doc = self._handle_response(response)
+        if "error" in doc:
+            return doc
+        content = doc.get("body", {}).get("content", [])
+        return max((element.get("endIndex", 1) for element in content), default=1)
+
+    def _invalidate(self, document_id: str) -> None:
+        """Drop cached metadata for a document after it has been modified."""
+        self._doc_cache.pop(document_id, None)
 
-    def insert_text(
+    def _shift_append_index(self, document_id: str, delta: int | None) -> None:
+        """Account for a queued update in the cached append index.
+
+        ``delta`` is how far the update moves the end of the body, or None when
+        that is not known up front (the cached index is then dropped).
+        """
+        cached = self._doc_cache.get(document_id)
+        if cached is None:
+            return
+        if delta is None:
+            self._invalidate(document_id)
+        elif delta:
+            self._doc_cache[document_id] = (cached[0], cached[1] + delta)
+
+    async def _get_append_index(self, document_id: str) -> int | dict[str, Any]:
+        """Return the index for appending to the document body, or an error dict.
+
+        The index comes from :meth:`get_document_tail` and is cached briefly
+        so consecutive appends skip the lookup entirely. The caller must hold
+        the document's index lock until the append is counted in the cache.
+        """
+        cached = self._doc_cache.get(document_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Let queued updates land first so the fetched index reflects them
+        await self._batcher.flush(document_id)
+        end_index = await self.get_document_tail(document_id)
+        if isinstance(end_index, dict):
+            return end_index
+        # Insert before the final newline, but never before the body start
+        append_index = max(end_index - 1, 1)
+        self._doc_cache[document_id] = (time.monotonic() + _END_INDEX_TTL_SECONDS, append_index)
+        return append_index
+
+    async def _send_batch_update(
+        self, document_id: str, requests: list[dict[str, Any]], parse_body: bool = True
+    ) -> dict[str, Any]:
+        """POST requests to documents.batchUpdate."""
+        _, result = await self._post_batch_update(document_id, requests, parse_body)
+        return result
+
+    async def _post_batch_update(
+        self, document_id: str, requests: list[dict[str, Any]], parse_body: bool = True
+    ) -> tuple[int, dict[str, Any]]:
+        """POST requests to documents.batchUpdate and return ``(status, result)``."""
+        await self._wait_for_batch_slot(document_id)
+        try:
+            response = await self._request_with_retry(
+                self._http.post,
+                self._urls_for(document_id).batch_update,
+                idempotent=False,
+                headers=self._headers,
+                content=_json_dumps({"requests": requests}),
+                timeout=_LONG_TIMEOUT,
+            )
+        except httpx.HTTPError:
+            self._invalidate(document_id)
+            raise
+        result = self._handle_response(response, parse_body=parse_body)
+        if "error" in result:
+            # Cached indexes already counted these updates, which did not apply
+            self._invalidate(document_id)
+        return response.status_code, result
+
+    async def _submit(
+        self,
+        document_id: str,
+        request: dict[str, Any],
+        end_delta: int | None = None,
+        parse_body: bool = True,
+    ) -> dict[str, Any]:
+        """Queue a single request, coalescing it with others for the same document.
+
+        Pass ``parse_body=False`` when only success or failure matters.
+        """
+        # Counting and queueing under the lock keeps the batch in the order
+        # the cached append index was moved
+        async with self._index_locks.hold(document_id):
+            self._shift_append_index(document_id, end_delta)
+            reply = self._batcher.enqueue(document_id, request, parse_body)
+        return await reply
+
+    async def flush(self, document_id: str) -> None:
+        """Send queued updates for a document immediately."""
+        await self._batcher.flush(document_id)
+
+    async def batch_update(
+        self, document_id: str, requests: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Execute multiple requests in a single atomic operation."""
+        # No append may look up the end index until this batch has landed
+        async with self._index_locks.hold(document_id):
+            # Queued single-request updates were submitted earlier, so they go first
+            await self._batcher.flush(document_id)
+            self._invalidate(document_id)
+            return await self._send_batch_update(document_id, requests)
+
+    async def insert_texts(self, document_id: str, items: list[tuple[int, str]]) -> dict[str, Any]:
+        """Insert several pieces of text, given as (index, text) pairs, in one batch update.
+
+        Indexes refer to the document as it is before any of the inserts. The
+        requests are sent from the highest index down, so earlier inserts never
+        shift the positions of later ones. Pieces sharing an index end up in
+        the order given.
+        """
+        ordered = sorted(enumerate(items), key=lambda item: (-item[1][0], -item[0]))
+        requests = [
+            {"insertText": {"location": {"index": index}, "text": text}}
+            for _, (index, text) in ordered
+        ]
+        return await self.batch_update(document_id, requests)
+
+    async def multi_apply(self, operations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run one batch update per operation, in parallel across documents.
+
+        Operations on the same document run one after another in the given
+        order; different documents are updated concurrently, at most
+        ``_MULTI_APPLY_CONCURRENCY`` at a time. Results are returned in
+        operation order, and a failed operation does not affect the others.
+        """
+        by_document: dict[str, list[int]] = defaultdict(list)
+        for position, operation in enumerate(operations):
+            by_document[operation["document_id"]].append(position)
+
+        results: list[dict[str, Any]] = [{} for _ in operations]
+        semaphore = asyncio.Semaphore(_MULTI_APPLY_CONCURRENCY)
+
+        async def apply(document_id: str, positions: list[int]) -> None:
+            async with semaphore:
+                for position in positions:
+                    try:
+                        result = await self.batch_update(
+                            document_id, operations[position]["requests"]
+                        )
+                    except httpx.TimeoutException:
+                        result = {"error": "Request timed out"}
+                    except httpx.RequestError as e:
+                        result = {"error": f"Network error: {e}"}
+                    results[position] = {"document_id": document_id, **result}
+
+        outcomes = await asyncio.gather(
+            *(apply(doc, positions) for doc, positions in by_document.items()),
+            return_exceptions=True,
+        )
+        for (document_id, positions), outcome in zip(by_document.items(), outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                for position in positions:
+                    if not results[position]:
+                        results[position] = {"document_id": document_id, "error": str(outcome)}
+        return results
+
+    async def insert_text(
         self,
         document_id: str,
         text: str,
@@ -274,24 +899,31 @@ def insert_text(
         location: dict[str, Any] = {}
         if segment_id:
             location["segmentId"] = segment_id
-        if index is not None:
-            location["index"] = index
-        else:
-            # Insert at end - we need to get doc first to find the end index
-            doc = self.get_document(document_id)
-            if "error" in doc:
-                return doc
-            location["index"] = _get_document_end_index(doc)
-
         request = {
             "insertText": {
                 "location": location,
                 "text": text,
             }
         }
-        return self.batch_update(document_id, [request])
-
-    def replace_all_text(
+        # Body inserts move the end of the document by exactly the inserted length
+        end_delta = None if segment_id else _utf16_len(text)
+        if index is not None:
+            location["index"] = index
+            return await self._submit(document_id, request, end_delta)
+
+        # Insert at end - look up (or reuse) the document's end index. The lock
+        # is held until this append is counted, so each concurrent append gets
+        # the index after the text of the one before it.
+        async with self._index_locks.hold(document_id):
+            append_index = await self._get_append_index(document_id)
+            if isinstance(append_index, dict):
+                return append_index
+            location["index"] = append_index
+            self._shift_append_index(document_id, end_delta)
+            reply = self._batcher.enqueue(document_id, request)
+        return await reply
+
+    async def replace_all_text(
         self,
         document_id: str,
         find_text: str,
@@ -311,9 +943,9 @@ def replace_all_text(
                 "replaceText": replace_text,
             }
         }
-        return self.batch_update(document_id, [request])
+        return await self._submit(document_id, request)
 
-    def insert_image(
+    async def insert_image(
         self,
         document_id: str,
         image_uri: str,
@@ -341,9 +973,9 @@ def insert_image(
                 object_size["height"] = {"magnitude": height_pt, "unit": "PT"}
             request["insertInlineImage"]["objectSize"] = object_size
 
-        return self.batch_update(document_id, [request])
+        return await self._submit(document_id, request)
 
-    def format_text(
+    async def format_text(
         self,
         document_id: str,
         start_index: int,
@@ -355,27 +987,27 @@ def format_text(
         foreground_color: dict[str, float] | None = None,
     ) -> dict[str, Any]:
         """Apply styling (bold, italic, font size, colors) to specific text ranges."""
-        text_style: dict[str, Any] = {}
-        fields: list[str] = []
+        mask = (
+            (bold is not None)
+            | (italic is not None) << 1
+            | (underline is not None) << 2
+            | (font_size_pt is not None) << 3
+            | (foreground_color is not None) << 4
+        )
+        if not mask:
+            return {"error": "No formatting options specified"}
 
+        text_style: dict[str, Any] = {}
         if bold is not None:
             text_style["bold"] = bold
-            fields.append("bold")
         if italic is not None:
             text_style["italic"] = italic
-            fields.append("italic")
         if underline is not None:
             text_style["underline"] = underline
-            fields.append("underline")
         if font_size_pt is not None:
             text_style["fontSize"] = {"magnitude": font_size_pt, "unit": "PT"}
-            fields.append("fontSize")
         if foreground_color is not None:
             text_style["foregroundColor"] = {"color": {"rgbColor": foreground_color}}
-            fields.append("foregroundColor")
-
-        if not fields:
-            return {"error": "No formatting options specified"}
 
         request = {
             "updateTextStyle": {
@@ -384,12 +1016,12 @@ def format_text(
                     "endIndex": end_index,
                 },
                 "textStyle": text_style,
-                "fields": ",".join(fields),
+                "fields": _FIELDS_TABLE[mask],
             }
         }
-        return self.batch_update(document_id, [request])
+        return await self._submit(document_id, request, end_delta=0, parse_body=False)
 
-    def create_list(
+    async def create_list(
         self,
         document_id: str,
         start_index: int,
@@ -406,9 +1038,9 @@ def create_list(
                 "bulletPreset": bullet_preset,
             }
         }
-        return self.batch_update(document_id, [request])
+        return await self._submit(document_id, request, parse_body=False)
 
-    def add_comment(
+    async def add_comment(
         self,
         document_id: str,
         content: str,
@@ -419,16 +1051,17 @@ def add_comment(
         if quoted_text:
             body["quotedFileContent"] = {"value": quoted_text}
 
-        response = httpx.post(
-            f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
+        response = await self._request_with_retry(
+            self._http.post,
+            self._urls_for(document_id).comments,
+            idempotent=False,
             headers=self._headers,
             params={"fields": "*"},
-            json=body,
-            timeout=30.0,
+            content=_json_dumps(body),
         )
         return self._handle_response(response)
 
-    def list_comments(
+    async def list_comments(
         self,
         document_id: str,
         page_size: int = 20,
@@ -444,35 +1077,77 @@ def list_comments(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
-            f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
+        response = await self._request_with_retry(
+            self._http.get,
+            self._urls_for(document_id).comments,
+            idempotent=True,
             headers=self._headers,
             params=params,
-            timeout=30.0,
         )
         return self._handle_response(response)
 
-    def export_document(
+    async def export_document(
         self,
         document_id: str,
         mime_type: str = "application/pdf",
+        encoding: str = "base64",
     ) -> dict[str, Any]:
-        """Export the document to different formats (PDF, DOCX, TXT)."""
-        response = httpx.get(
-            f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/export",
+        """Export the document to different formats (PDF, DOCX, TXT).
+
+        The export is streamed and base64-encoded chunk by chunk, so the raw
+        file is never held in memory next to its encoded copy. Pass
+        ``encoding="raw"`` to get the bytes back as ``content_bytes`` instead.
+        """
+        token = self._token
+        result = await self._stream_export(document_id, mime_type, encoding)
+        if result.get("error") == _UNAUTHORIZED_ERROR and self._refresh_token(token):
+            result = await self._stream_export(document_id, mime_type, encoding)
+        return result
+
+    async def _stream_export(
+        self, document_id: str, mime_type: str, encoding: str
+    ) -> dict[str, Any]:
+        async with self._http.stream(
+            "GET",
+            self._urls_for(document_id).export,
             headers=self._headers,
             params={"mimeType": mime_type},
-            timeout=60.0,
-        )
-        if response.status_code == 200:
-            # Return base64-encoded content for binary formats
-            return {
-                "document_id": document_id,
-                "mime_type": mime_type,
-                "content_base64": base64.b64encode(response.content).decode("utf-8"),
-                "size_bytes": len(response.content),
-            }
-        return self._handle_response(response)
+            timeout=_LONG_TIMEOUT,
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return self._handle_response(response)
+
+            size = 0
+            if encoding == "raw":
+                raw_chunks: list[bytes] = []
+                async for chunk in response.aiter_bytes(_EXPORT_CHUNK_SIZE):
+                    size += len(chunk)
+                    raw_chunks.append(chunk)
+                return {
+                    "document_id": document_id,
+                    "mime_type": mime_type,
+                    "content_bytes": b"".join(raw_chunks),
+                    "size_bytes": size,
+                }
+
+            # Encode whole 3-byte groups per chunk so the pieces concatenate cleanly
+            encoded: list[str] = []
+            leftover = b""
+            async for chunk in response.aiter_bytes(_EXPORT_CHUNK_SIZE):
+                size += len(chunk)
+                data = leftover + chunk
+                cut = len(data) - len(data) % 3
+                encoded.append(binascii.b2a_base64(data[:cut], newline=False).decode("ascii"))
+                leftover = data[cut:]
+            encoded.append(binascii.b2a_base64(leftover, newline=False).decode("ascii"))
+
+        return {
+            "document_id": document_id,
+            "mime_type": mime_type,
+            "content_base64": "".join(encoded),
+            "size_bytes": size,
+        }
 
 
 def register_tools(
@@ -481,49 +1156,92 @@ def register_tools(
 ) -> None:
     """Register Google Docs tools with the MCP server."""
 
-    def _get_token(account: str = "") -> str | None:
-        """Get Google access token from credential manager or environment."""
+    # account -> (access token, monotonic time after which it is fetched again)
+    _token_cache: dict[str, tuple[str, float]] = {}
+
+    def _resolve_token(account: str) -> tuple[str | None, float | None]:
+        """Look up an access token and its lifetime in seconds, if known."""
         if credentials is not None:
             if account:
-                return credentials.get_by_alias(
+                token = credentials.get_by_alias(
                     "google_docs",
                     account,
                 )
-            token = credentials.get("google_docs")
-            if token is not None and not isinstance(token, str):
-                raise TypeError(
-                    f"Expected string from credentials.get('google_docs'), "
-                    f"got {type(token).__name__}"
-                )
-            return token
+            else:
+                token = credentials.get("google_docs")
+                if token is not None and not isinstance(token, str):
+                    raise TypeError(
+                        f"Expected string from credentials.get('google_docs'), "
+                        f"got {type(token).__name__}"
+                    )
+            if not token:
+                return token, None
+            return token, min(_token_lifetime(token), _STORE_TOKEN_LIFETIME_SECONDS)
         # Try environment variables - direct access token first
         token = os.getenv("GOOGLE_DOCS_ACCESS_TOKEN")
         if token:
-            return token
+            return token, None
         # Try service account JSON with proper JWT token exchange
         service_account = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
         if service_account:
             return _create_service_account_token(service_account)
-        return None
+        return None, None
+
+    def _get_token(account: str = "") -> str | None:
+        """Get Google access token from credential manager or environment.
+
+        Tokens are cached per account and only looked up again shortly before
+        they expire.
+        """
+        cached = _token_cache.get(account)
+        now = time.monotonic()
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        token, lifetime = _resolve_token(account)
+        if token:
+            if lifetime is None:
+                lifetime = _token_lifetime(token)
+            _token_cache[account] = (token, now + lifetime - _TOKEN_REFRESH_MARGIN_SECONDS)
+        else:
+            _token_cache.pop(account, None)
+        return token
+
+    # access token -> client, least recently used first
+    _client_cache: OrderedDict[str, _GoogleDocsClient] = OrderedDict()
+
+    def _renew_token(account: str, rejected: str) -> str | None:
+        """Forget a token the API rejected and look the account's token up again."""
+        cached = _token_cache.get(account)
+        if cached is not None and cached[0] == rejected:
+            del _token_cache[account]
+        _client_cache.pop(rejected, None)
+        return _get_token(account)
 
     def _get_client(account: str = "") -> _GoogleDocsClient | dict[str, str]:
-        """Get a Google Docs client, or return an error dict if no credentials."""
+        """Get a Google Docs client, or return an error dict if no credentials.
+
+        Clients are reused per token so their caches and batching carry over
+        between tool calls.
+        """
         token = _get_token(account)
         if not token:
-            return {
-                "error": "Google Docs credentials not configured",
-                "help": (
-                    "Set GOOGLE_DOCS_ACCESS_TOKEN environment variable "
-                    "or configure via credential store. "
-                    "Get credentials at: https://console.cloud.google.com/apis/credentials"
-                ),
-            }
-        return _GoogleDocsClient(token)
+            return _NO_CREDS_ERROR
+        client = _client_cache.get(token)
+        if client is None:
+            client = _GoogleDocsClient(token, functools.partial(_renew_token, account))
+            _client_cache[token] = client
+            if len(_client_cache) > _CLIENT_CACHE_SIZE:
+                # Connections live on the shared module client, so dropping is enough
+                _client_cache.popitem(last=False)
+        else:
+            _client_cache.move_to_end(token)
+        return client
 
     # --- Document Management ---
 
     @mcp.tool()
-    def google_docs_create_document(title: str, account: str = "") -> dict:
+    async def google_docs_create_document(title: str, account: str = "") -> dict:
         """
         Create a new blank Google Docs document with a specified title.
 
@@ -537,7 +1255,7 @@ def google_docs_create_document(title: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.create_document(title)
+            result = await client.create_document(title)
             if "error" not in result:
                 return {
                     "document_id": result.get("documentId"),
@@ -551,7 +1269,7 @@ def google_docs_create_document(title: str, account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_get_document(document_id: str, account: str = "") -> dict:
+    async def google_docs_get_document(document_id: str, account: str = "") -> dict:
         """
         Retrieve the full structural content, metadata, and elements of a document.
 
@@ -565,14 +1283,14 @@ def google_docs_get_document(document_id: str, account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            return client.get_document(document_id)
+            return await client.get_document(document_id)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_insert_text(
+    async def google_docs_insert_text(
         document_id: str,
         text: str,
         index: int | None = None,
@@ -595,14 +1313,14 @@ def google_docs_insert_text(
         if isinstance(client, dict):
             return client
         try:
-            return client.insert_text(document_id, text, index)
+            return await client.insert_text(document_id, text, index)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_replace_all_text(
+    async def google_docs_replace_all_text(
         document_id: str,
         find_text: str,
         replace_text: str,
@@ -627,7 +1345,7 @@ def google_docs_replace_all_text(
         if isinstance(client, dict):
             return client
         try:
-            result = client.replace_all_text(document_id, find_text, replace_text, match_case)
+            result = await client.replace_all_text(document_id, find_text, replace_text, match_case)
             if "error" not in result:
                 # Extract replacement count from response
                 replies = result.get("replies", [])
@@ -648,7 +1366,7 @@ def google_docs_replace_all_text(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_insert_image(
+    async def google_docs_insert_image(
         document_id: str,
         image_uri: str,
         index: int,
@@ -675,14 +1393,14 @@ def google_docs_insert_image(
         if isinstance(client, dict):
             return client
         try:
-            return client.insert_image(document_id, image_uri, index, width_pt, height_pt)
+            return await client.insert_image(document_id, image_uri, index, width_pt, height_pt)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_format_text(
+    async def google_docs_format_text(
         document_id: str,
         start_index: int,
         end_index: int,
@@ -729,7 +1447,7 @@ def google_docs_format_text(
             }
 
         try:
-            return client.format_text(
+            return await client.format_text(
                 document_id,
                 start_index,
                 end_index,
@@ -745,7 +1463,7 @@ def google_docs_format_text(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_batch_update(
+    async def google_docs_batch_update(
         document_id: str,
         requests_json: str,
         account: str = "",
@@ -767,19 +1485,108 @@ def google_docs_batch_update(
         if isinstance(client, dict):
             return client
         try:
-            requests = json.loads(requests_json)
+            if len(requests_json) > _THREADED_PARSE_THRESHOLD:
+                # Keep large agent-supplied payloads from stalling the event loop
+                requests = await asyncio.to_thread(_json_loads, requests_json)
+            else:
+                requests = _json_loads(requests_json)
             if not isinstance(requests, list):
                 return {"error": "requests_json must be a JSON array of request objects"}
-            return client.batch_update(document_id, requests)
+            return await client.batch_update(document_id, requests)
+        except json.JSONDecodeError as e:
+            return {"error": f"Invalid JSON: {e}"}
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
+
+    @mcp.tool()
+    async def google_docs_insert_texts(
+        document_id: str,
+        items_json: str,
+        account: str = "",
+    ) -> dict:
+        """
+        Insert several pieces of text into a document in one atomic operation.
+
+        Indexes refer to the document before any insertion; the tool orders the
+        inserts so they do not shift each other.
+
+        Args:
+            document_id: The ID of the Google Docs document
+            items_json: JSON array of {"index": int, "text": str} objects (1-based indexes)
+
+        Returns:
+            Dict with batch update result, or error
+        """
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+        try:
+            items = _json_loads(items_json)
         except json.JSONDecodeError as e:
             return {"error": f"Invalid JSON: {e}"}
+        if not isinstance(items, list) or not items:
+            return {"error": "items_json must be a non-empty JSON array"}
+        pairs: list[tuple[int, str]] = []
+        for item in items:
+            if not isinstance(item, dict):
+                return {"error": 'Each item must be an object like {"index": 1, "text": "..."}'}
+            index, text = item.get("index"), item.get("text")
+            if not isinstance(index, int) or isinstance(index, bool) or index < 1:
+                return {"error": "Each item needs an integer index of at least 1"}
+            if not isinstance(text, str) or not text:
+                return {"error": "Each item needs non-empty text"}
+            pairs.append((index, text))
+        try:
+            return await client.insert_texts(document_id, pairs)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_create_list(
+    async def google_docs_multi_apply(operations_json: str, account: str = "") -> dict:
+        """
+        Apply batch updates to several documents concurrently.
+
+        Each operation is its own atomic batchUpdate, so one failing operation
+        does not affect the others. Operations on the same document are applied
+        in order.
+
+        Args:
+            operations_json: JSON array of objects, each with a "document_id" string
+                and a "requests" array of batchUpdate request objects
+
+        Returns:
+            Dict with per-operation "results" in the same order as the input, or error
+        """
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+        try:
+            if len(operations_json) > _THREADED_PARSE_THRESHOLD:
+                operations = await asyncio.to_thread(_json_loads, operations_json)
+            else:
+                operations = _json_loads(operations_json)
+        except json.JSONDecodeError as e:
+            return {"error": f"Invalid JSON: {e}"}
+        if not isinstance(operations, list) or not all(
+            isinstance(op, dict)
+            and isinstance(op.get("document_id"), str)
+            and op["document_id"]
+            and isinstance(op.get("requests"), list)
+            for op in operations
+        ):
+            return {
+                "error": "operations_json must be a JSON array of "
+                '{"document_id": ..., "requests": [...]} objects'
+            }
+        results = await client.multi_apply(operations)
+        return {"results": results, "failed": sum(1 for r in results if "error" in r)}
+
+    @mcp.tool()
+    async def google_docs_create_list(
         document_id: str,
         start_index: int,
         end_index: int,
@@ -802,21 +1609,17 @@ def google_docs_create_list(
         if isinstance(client, dict):
             return client
 
-        bullet_presets = {
-            "bullet": "BULLET_DISC_CIRCLE_SQUARE",
-            "numbered": "NUMBERED_DECIMAL_ALPHA_ROMAN",
-        }
-        preset = bullet_presets.get(list_type.lower(), "BULLET_DISC_CIRCLE_SQUARE")
+        preset = _BULLET_PRESETS.get(list_type.lower(), "BULLET_DISC_CIRCLE_SQUARE")
 
         try:
-            return client.create_list(document_id, start_index, end_index, preset)
+            return await client.create_list(document_id, start_index, end_index, preset)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_add_comment(
+    async def google_docs_add_comment(
         document_id: str,
         content: str,
         quoted_text: str | None = None,
@@ -839,14 +1642,14 @@ def google_docs_add_comment(
         if isinstance(client, dict):
             return client
         try:
-            return client.add_comment(document_id, content, quoted_text)
+            return await client.add_comment(document_id, content, quoted_text)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_list_comments(
+    async def google_docs_list_comments(
         document_id: str,
         page_size: int = 20,
         page_token: str | None = None,
@@ -871,7 +1674,7 @@ def google_docs_list_comments(
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_comments(document_id, page_size, page_token, include_deleted)
+            result = await client.list_comments(document_id, page_size, page_token, include_deleted)
             if "error" in result:
                 return result
             return {
@@ -885,7 +1688,7 @@ def google_docs_list_comments(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_export_content(
+    async def google_docs_export_content(
         document_id: str,
         format: str = "pdf",
         account: str = "",
@@ -904,19 +1707,10 @@ def google_docs_export_content(
         if isinstance(client, dict):
             return client
 
-        mime_types = {
-            "pdf": "application/pdf",
-            "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "txt": "text/plain",
-            "html": "text/html",
-            "odt": "application/vnd.oasis.opendocument.text",
-            "rtf": "application/rtf",
-            "epub": "application/epub+zip",
-        }
-        mime_type = mime_types.get(format.lower(), "application/pdf")
+        mime_type = _MIME_TYPES.get(format.lower(), "application/pdf")
 
         try:
-            return client.export_document(document_id, mime_type)
+            return await client.export_document(document_id, mime_type)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
@@ -5,13 +5,29 @@
 without requiring actual Google API credentials.
 """
 
+import asyncio
+import base64
 import json
-from unittest.mock import MagicMock, patch
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastmcp import FastMCP
 
-from aden_tools.tools.google_docs_tool import register_tools
+from aden_tools.tools.google_docs_tool import google_docs_tool, register_tools
+
+
+@pytest.fixture(autouse=True)
+async def _reset_shared_state():
+    """Clear module- and class-level state so tests do not depend on order."""
+    google_docs_tool._GoogleDocsClient._next_batch_slot.clear()
+    google_docs_tool._GoogleDocsClient._inflight.clear()
+    yield
+    google_docs_tool._GoogleDocsClient._next_batch_slot.clear()
+    google_docs_tool._GoogleDocsClient._inflight.clear()
+    await google_docs_tool.close_http_client()
 
 
 @pytest.fixture
@@ -32,6 +48,18 @@ def mcp_with_credentials():
     return server
 
 
+def _json_response(status_code: int, body=None) -> httpx.Response:
+    """Build an API response carrying a JSON body."""
+    if body is None:
+        return httpx.Response(status_code)
+    return httpx.Response(status_code, json=body)
+
+
+def _sent_json(call) -> dict:
+    """Decode the JSON body passed to a mocked request."""
+    return json.loads(call.kwargs["content"])
+
+
 def get_tool_fn(mcp, tool_name: str):
     """Helper to get a tool function from the MCP server."""
     return mcp._tool_manager._tools[tool_name].fn
@@ -40,53 +68,53 @@ def get_tool_fn(mcp, tool_name: str):
 class TestGoogleDocsCreateDocument:
     """Tests for google_docs_create_document tool."""
 
-    def test_no_credentials_returns_error(self, mcp):
+    async def test_no_credentials_returns_error(self, mcp):
         """Test that missing credentials returns a helpful error."""
         with patch.dict("os.environ", {}, clear=True):
             tool_fn = get_tool_fn(mcp, "google_docs_create_document")
-            result = tool_fn(title="Test Document")
+            result = await tool_fn(title="Test Document")
             assert "error" in result
             assert "not configured" in result["error"]
             assert "help" in result
 
-    def test_service_account_json_without_access_token_is_not_used(self, mcp):
+    async def test_service_account_json_without_access_token_is_not_used(self, mcp):
         """Test that service account JSON alone is not treated as an access token."""
         with patch.dict(
             "os.environ", {"GOOGLE_SERVICE_ACCOUNT_JSON": '{"type":"service_account"}'}
         ):
             tool_fn = get_tool_fn(mcp, "google_docs_create_document")
-            result = tool_fn(title="Test Document")
+            result = await tool_fn(title="Test Document")
             assert "error" in result
             assert "not configured" in result["error"]
 
-    @patch("httpx.post")
-    def test_create_document_success(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_create_document_success(self, mock_post, mcp_with_credentials):
         """Test successful document creation."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "documentId": "doc123",
-            "title": "Test Document",
-        }
+        mock_response = _json_response(
+            200,
+            {
+                "documentId": "doc123",
+                "title": "Test Document",
+            },
+        )
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_create_document")
-        result = tool_fn(title="Test Document")
+        result = await tool_fn(title="Test Document")
 
         assert result["document_id"] == "doc123"
         assert result["title"] == "Test Document"
         assert "document_url" in result
         assert "doc123" in result["document_url"]
 
-    @patch("httpx.post")
-    def test_create_document_unauthorized(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_create_document_unauthorized(self, mock_post, mcp_with_credentials):
         """Test handling of 401 unauthorized response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
+        mock_response = _json_response(401)
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_create_document")
-        result = tool_fn(title="Test Document")
+        result = await tool_fn(title="Test Document")
 
         assert "error" in result
         assert "expired" in result["error"].lower() or "invalid" in result["error"].lower()
@@ -95,53 +123,97 @@ def test_create_document_unauthorized(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsGetDocument:
     """Tests for google_docs_get_document tool."""
 
-    @patch("httpx.get")
-    def test_get_document_success(self, mock_get, mcp_with_credentials):
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_document_success(self, mock_get, mcp_with_credentials):
         """Test successful document retrieval."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "documentId": "doc123",
-            "title": "Test Document",
-            "body": {"content": []},
-        }
+        mock_response = _json_response(
+            200,
+            {
+                "documentId": "doc123",
+                "title": "Test Document",
+                "body": {"content": []},
+            },
+        )
         mock_get.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_get_document")
-        result = tool_fn(document_id="doc123")
+        result = await tool_fn(document_id="doc123")
 
         assert result["documentId"] == "doc123"
         assert result["title"] == "Test Document"
 
-    @patch("httpx.get")
-    def test_get_document_not_found(self, mock_get, mcp_with_credentials):
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_document_not_found(self, mock_get, mcp_with_credentials):
         """Test handling of 404 not found response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
+        mock_response = _json_response(404)
         mock_get.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_get_document")
-        result = tool_fn(document_id="nonexistent")
+        result = await tool_fn(document_id="nonexistent")
 
         assert "error" in result
         assert "not found" in result["error"].lower()
 
 
+class TestGetDocumentSingleFlight:
+    """Tests for sharing concurrent document fetches."""
+
+    async def test_concurrent_fetches_share_one_request(self):
+        """Test that racing get_document calls for one document send a single GET."""
+        release = asyncio.Event()
+        calls = []
+
+        async def fake_get(self, url, **kwargs):
+            calls.append(url)
+            await release.wait()
+            return _json_response(200, {"documentId": url.rsplit("/", 1)[-1]})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        other = google_docs_tool._GoogleDocsClient("test-access-token")
+        with patch("httpx.AsyncClient.get", new=fake_get):
+            pending = asyncio.gather(
+                client.get_document("doc123"),
+                other.get_document("doc123"),
+                client.get_document("doc456"),
+            )
+            await asyncio.sleep(0)
+            release.set()
+            first, second, third = await pending
+
+        assert len(calls) == 2
+        assert first is second
+        assert third == {"documentId": "doc456"}
+        assert not google_docs_tool._GoogleDocsClient._inflight
+
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_failed_fetch_is_not_reused(self, mock_get):
+        """Test that an error does not stick around for later callers."""
+        mock_get.side_effect = [
+            httpx.ConnectError("boom"),
+            _json_response(200, {"documentId": "doc123"}),
+        ]
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        with pytest.raises(httpx.ConnectError):
+            await client.get_document("doc123")
+
+        assert await client.get_document("doc123") == {"documentId": "doc123"}
+
+
 class TestGoogleDocsReplaceAllText:
     """Tests for google_docs_replace_all_text tool."""
 
-    @patch("httpx.post")
-    def test_replace_all_text_success(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_replace_all_text_success(self, mock_post, mcp_with_credentials):
         """Test successful find and replace."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "replies": [{"replaceAllText": {"occurrencesChanged": 3}}]
-        }
+        mock_response = _json_response(
+            200,
+            {"replies": [{"replaceAllText": {"occurrencesChanged": 3}}]},
+        )
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_replace_all_text")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             find_text="{{placeholder}}",
             replace_text="actual value",
@@ -155,54 +227,186 @@ def test_replace_all_text_success(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsInsertText:
     """Tests for google_docs_insert_text tool."""
 
-    @patch("httpx.post")
-    @patch("httpx.get")
-    def test_insert_text_at_end(self, mock_get, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_insert_text_at_end(self, mock_get, mock_post, mcp_with_credentials):
         """Test inserting text at the end of document."""
         # Mock get document for finding end index
-        mock_get_response = MagicMock()
-        mock_get_response.status_code = 200
-        mock_get_response.json.return_value = {"body": {"content": [{"endIndex": 100}]}}
+        mock_get_response = _json_response(200, {"body": {"content": [{"endIndex": 100}]}})
         mock_get.return_value = mock_get_response
 
         # Mock batch update
-        mock_post_response = MagicMock()
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = {"replies": []}
+        mock_post_response = _json_response(200, {"replies": []})
         mock_post.return_value = mock_post_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_text")
-        result = tool_fn(document_id="doc123", text="Hello, World!")
+        result = await tool_fn(document_id="doc123", text="Hello, World!")
 
         assert "error" not in result
 
-    @patch("httpx.post")
-    def test_insert_text_at_index(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_append_fetches_only_end_index_and_caches_it(self, mock_get, mock_post):
+        """Test that appends request a fields mask and reuse the cached end index."""
+        mock_get_response = _json_response(200, {"body": {"content": [{"endIndex": 100}]}})
+        mock_get.return_value = mock_get_response
+
+        mock_post_response = _json_response(200, {"replies": [{}]})
+        mock_post.return_value = mock_post_response
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        await client.insert_text("doc123", "Hello")
+        await client.insert_text("doc123", "é!")
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"] == {"fields": "body(content(endIndex))"}
+        first, second = (_sent_json(c)["requests"][0] for c in mock_post.call_args_list)
+        assert first["insertText"]["location"]["index"] == 99
+        assert second["insertText"]["location"]["index"] == 104
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_other_updates_invalidate_cached_end_index(self, mock_get, mock_post):
+        """Test that a non-append update forces the end index to be fetched again."""
+        mock_get_response = _json_response(200, {"body": {"content": [{"endIndex": 100}]}})
+        mock_get.return_value = mock_get_response
+
+        mock_post_response = _json_response(200, {"replies": [{}]})
+        mock_post.return_value = mock_post_response
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        await client.insert_text("doc123", "Hello")
+        await client.replace_all_text("doc123", "{{name}}", "Jane")
+        await client.insert_text("doc123", "World")
+
+        assert mock_get.call_count == 2
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_concurrent_appends_do_not_share_an_index(self, mock_post):
+        """Test that appends racing a cold cache each land after the previous one."""
+
+        async def fake_get(self, url, **kwargs):
+            await asyncio.sleep(0)
+            return _json_response(200, {"body": {"content": [{"endIndex": 11}]}})
+
+        mock_post.return_value = _json_response(200, {"replies": [{}, {}]})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        with patch("httpx.AsyncClient.get", new=fake_get):
+            await asyncio.gather(
+                client.insert_text("doc123", "AAAA"),
+                client.insert_text("doc123", "BB"),
+            )
+
+        sent = [
+            (r["insertText"]["location"]["index"], r["insertText"]["text"])
+            for c in mock_post.call_args_list
+            for r in _sent_json(c)["requests"]
+        ]
+        assert sent == [(10, "AAAA"), (14, "BB")]
+        assert client._doc_cache["doc123"][1] == 16
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_update_during_end_index_lookup_is_not_lost(self, mock_post):
+        """Test that an update queued while the end index is fetched drops the result."""
+        fetching = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_get(self, url, **kwargs):
+            fetching.set()
+            await release.wait()
+            return _json_response(200, {"body": {"content": [{"endIndex": 11}]}})
+
+        mock_post.return_value = _json_response(200, {"replies": [{}]})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        with patch("httpx.AsyncClient.get", new=fake_get):
+            append = asyncio.create_task(client.insert_text("doc123", "AAAA"))
+            await fetching.wait()
+            replace = asyncio.create_task(client.replace_all_text("doc123", "{{x}}", "longer"))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(append, replace)
+
+        assert "doc123" not in client._doc_cache
+
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_document_tail_returns_max_end_index(self, mock_get):
+        """Test that the tail lookup uses a fields mask and the largest endIndex."""
+        mock_get_response = _json_response(
+            200,
+            {"body": {"content": [{"endIndex": 1}, {"endIndex": 42}, {"startIndex": 0}]}},
+        )
+        mock_get.return_value = mock_get_response
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+
+        assert await client.get_document_tail("doc123") == 42
+        assert mock_get.call_args.kwargs["params"] == {"fields": "body(content(endIndex))"}
+
+        mock_get_response.status_code = 404
+        assert "not found" in (await client.get_document_tail("missing"))["error"].lower()
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_insert_text_at_index(self, mock_post, mcp_with_credentials):
         """Test inserting text at a specific index."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"replies": []}
+        mock_response = _json_response(200, {"replies": []})
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_text")
-        result = tool_fn(document_id="doc123", text="Inserted", index=10)
+        result = await tool_fn(document_id="doc123", text="Inserted", index=10)
 
         assert "error" not in result
 
 
+class TestGoogleDocsInsertTexts:
+    """Tests for google_docs_insert_texts tool."""
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_inserts_sent_backwards_in_one_batch(self, mock_post, mcp_with_credentials):
+        """Test that inserts go out highest index first, keeping caller order on ties."""
+        mock_post.return_value = _json_response(200, {"replies": [{}, {}, {}, {}]})
+        items = [
+            {"index": 1, "text": "Title"},
+            {"index": 20, "text": "a"},
+            {"index": 5, "text": "Intro"},
+            {"index": 20, "text": "b"},
+        ]
+
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_texts")
+        result = await tool_fn(document_id="doc123", items_json=json.dumps(items))
+
+        assert "error" not in result
+        mock_post.assert_called_once()
+        sent = [r["insertText"] for r in _sent_json(mock_post.call_args)["requests"]]
+        assert [(r["location"]["index"], r["text"]) for r in sent] == [
+            (20, "b"),
+            (20, "a"),
+            (5, "Intro"),
+            (1, "Title"),
+        ]
+
+    async def test_invalid_items_rejected(self, mcp_with_credentials):
+        """Test validation of the items payload."""
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_texts")
+
+        assert "Invalid JSON" in (await tool_fn(document_id="doc123", items_json="nope"))["error"]
+        assert "non-empty" in (await tool_fn(document_id="doc123", items_json="[]"))["error"]
+        result = await tool_fn(document_id="doc123", items_json='[{"index": 0, "text": "x"}]')
+        assert "index" in result["error"]
+
+
 class TestGoogleDocsFormatText:
     """Tests for google_docs_format_text tool."""
 
-    @patch("httpx.post")
-    def test_format_text_bold(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_format_text_bold(self, mock_post, mcp_with_credentials):
         """Test applying bold formatting."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"replies": []}
+        mock_response = _json_response(200, {"replies": []})
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_format_text")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             start_index=1,
             end_index=10,
@@ -211,10 +415,24 @@ def test_format_text_bold(self, mock_post, mcp_with_credentials):
 
         assert "error" not in result
 
-    def test_format_text_no_options(self, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_format_text_fields_mask(self, mock_post):
+        """Test that the fields mask lists exactly the styles that were set, in order."""
+        mock_post.return_value = _json_response(200, {"replies": [{}]})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        await client.format_text(
+            "doc123", 1, 10, italic=False, font_size_pt=12.0, foreground_color={"red": 1.0}
+        )
+
+        request = _sent_json(mock_post.call_args)["requests"][0]["updateTextStyle"]
+        assert request["fields"] == "italic,fontSize,foregroundColor"
+        assert set(request["textStyle"]) == {"italic", "fontSize", "foregroundColor"}
+
+    async def test_format_text_no_options(self, mcp_with_credentials):
         """Test error when no formatting options specified."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_format_text")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             start_index=1,
             end_index=10,
@@ -227,12 +445,10 @@ def test_format_text_no_options(self, mcp_with_credentials):
 class TestGoogleDocsBatchUpdate:
     """Tests for google_docs_batch_update tool."""
 
-    @patch("httpx.post")
-    def test_batch_update_success(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_batch_update_success(self, mock_post, mcp_with_credentials):
         """Test successful batch update."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"replies": [{}, {}]}
+        mock_response = _json_response(200, {"replies": [{}, {}]})
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_batch_update")
@@ -242,73 +458,317 @@ def test_batch_update_success(self, mock_post, mcp_with_credentials):
                 {"insertText": {"location": {"index": 6}, "text": " World"}},
             ]
         )
-        result = tool_fn(document_id="doc123", requests_json=requests)
+        result = await tool_fn(document_id="doc123", requests_json=requests)
 
         assert "error" not in result
 
-    def test_batch_update_invalid_json(self, mcp_with_credentials):
+    async def test_batch_update_invalid_json(self, mcp_with_credentials):
         """Test error handling for invalid JSON."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_batch_update")
-        result = tool_fn(document_id="doc123", requests_json="not valid json")
+        result = await tool_fn(document_id="doc123", requests_json="not valid json")
 
         assert "error" in result
         assert "Invalid JSON" in result["error"]
 
-    def test_batch_update_not_array(self, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_large_batch_update_parsed_off_event_loop(self, mock_post, mcp_with_credentials):
+        """Test that very large requests_json payloads are parsed in a worker thread."""
+        mock_post.return_value = _json_response(200, {"replies": [{}]})
+        text = "x" * (google_docs_tool._THREADED_PARSE_THRESHOLD + 1)
+        requests = json.dumps([{"insertText": {"location": {"index": 1}, "text": text}}])
+
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_batch_update")
+        with patch.object(
+            google_docs_tool.asyncio, "to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            result = await tool_fn(document_id="doc123", requests_json=requests)
+
+        assert "error" not in result
+        to_thread.assert_called_once()
+        sent = _sent_json(mock_post.call_args)["requests"]
+        assert sent[0]["insertText"]["text"] == text
+
+    async def test_batch_update_not_array(self, mcp_with_credentials):
         """Test error handling when JSON is not an array."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_batch_update")
-        result = tool_fn(document_id="doc123", requests_json='{"not": "array"}')
+        result = await tool_fn(document_id="doc123", requests_json='{"not": "array"}')
 
         assert "error" in result
         assert "array" in result["error"].lower()
 
 
+class TestGoogleDocsMultiApply:
+    """Tests for google_docs_multi_apply tool."""
+
+    async def test_documents_updated_concurrently_in_operation_order(self, mcp_with_credentials):
+        """Test that different documents overlap while results keep input order."""
+        in_flight = 0
+        peak = 0
+        calls = []
+
+        async def fake_post(self, url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "bad" in url:
+                return _json_response(400, {"error": {"message": "Invalid range"}})
+            return _json_response(200, {"replies": [{}]})
+
+        operations = json.dumps(
+            [
+                {"document_id": "doc1", "requests": [{"deleteContentRange": {}}]},
+                {"document_id": "bad", "requests": [{"deleteContentRange": {}}]},
+                {"document_id": "doc2", "requests": [{"deleteContentRange": {}}]},
+            ]
+        )
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_multi_apply")
+        with patch("httpx.AsyncClient.post", new=fake_post):
+            result = await tool_fn(operations_json=operations)
+
+        assert peak == 3
+        assert [r["document_id"] for r in result["results"]] == ["doc1", "bad", "doc2"]
+        assert "Invalid range" in result["results"][1]["error"]
+        assert result["results"][0]["replies"] == [{}]
+        assert result["failed"] == 1
+
+    async def test_same_document_operations_run_sequentially(self, mcp_with_credentials):
+        """Test that operations on one document are not sent concurrently."""
+        in_flight = 0
+        sent = []
+
+        async def fake_post(self, url, **kwargs):
+            nonlocal in_flight
+            in_flight += 1
+            assert in_flight == 1
+            sent.append(json.loads(kwargs["content"])["requests"][0])
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _json_response(200, {"replies": [{}]})
+
+        operations = json.dumps(
+            [{"document_id": "doc1", "requests": [{"step": n}]} for n in range(3)]
+        )
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_multi_apply")
+        with patch("httpx.AsyncClient.post", new=fake_post):
+            result = await tool_fn(operations_json=operations)
+
+        assert sent == [{"step": 0}, {"step": 1}, {"step": 2}]
+        assert result["failed"] == 0
+
+    async def test_invalid_operations_rejected(self, mcp_with_credentials):
+        """Test validation of the operations payload."""
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_multi_apply")
+
+        result = await tool_fn(operations_json="not valid json")
+        assert "Invalid JSON" in result["error"]
+
+        result = await tool_fn(operations_json='[{"document_id": "doc1"}]')
+        assert "operations_json must be" in result["error"]
+
+
+class TestBatchCoalescing:
+    """Tests for coalescing single-request updates into one batchUpdate."""
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_concurrent_updates_share_one_request(self, mock_post):
+        """Test that updates queued in the same window go out as one batch."""
+        mock_response = _json_response(
+            200,
+            {
+                "documentId": "doc123",
+                "replies": [{}, {"replaceAllText": {"occurrencesChanged": 2}}],
+            },
+        )
+        mock_post.return_value = mock_response
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        formatted, replaced = await asyncio.gather(
+            client.format_text("doc123", 1, 5, bold=True),
+            client.replace_all_text("doc123", "{{name}}", "Jane"),
+        )
+
+        mock_post.assert_called_once()
+        sent = _sent_json(mock_post.call_args)["requests"]
+        assert [next(iter(r)) for r in sent] == ["updateTextStyle", "replaceAllText"]
+        assert formatted == {"ok": True, "status": 200}
+        assert replaced["replies"] == [{"replaceAllText": {"occurrencesChanged": 2}}]
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_body_not_decoded_when_no_caller_needs_it(self, mock_post):
+        """Test that style-only batches return a status summary without decoding."""
+        mock_post.return_value = httpx.Response(200, content=b"not json")
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        formatted, listed = await asyncio.gather(
+            client.format_text("doc123", 1, 5, bold=True),
+            client.create_list("doc123", 1, 5),
+        )
+
+        mock_post.assert_called_once()
+        assert formatted == {"ok": True, "status": 200}
+        assert listed == {"ok": True, "status": 200}
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_failed_batch_is_retried_per_request(self, mock_post):
+        """Test that one invalid request does not fail the others in its batch."""
+        bad = _json_response(400, {"error": {"message": "Invalid range"}})
+        ok = _json_response(200, {"replies": [{}]})
+        mock_post.side_effect = [bad, ok, bad]
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        good_result, bad_result = await asyncio.gather(
+            client.format_text("doc123", 1, 5, bold=True),
+            client.format_text("doc123", 500, 900, bold=True),
+        )
+
+        assert mock_post.call_count == 3
+        assert "error" not in good_result
+        assert "Invalid range" in bad_result["error"]
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_non_400_batch_error_is_not_resent(self, mock_post):
+        """Test that errors other than 400 reach every caller without a resend."""
+        mock_post.return_value = _json_response(403, {})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        results = await asyncio.gather(
+            client.format_text("doc123", 1, 5, bold=True),
+            client.format_text("doc123", 6, 9, italic=True),
+        )
+
+        mock_post.assert_called_once()
+        assert all("Insufficient permissions" in r["error"] for r in results)
+        assert not client._batcher._locks
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_coalesced_appends_queued_in_index_order(self, mock_post):
+        """Test that appends sharing a batch are queued in the order their indexes were given."""
+
+        async def fake_get(self, url, **kwargs):
+            await asyncio.sleep(0)
+            return _json_response(200, {"body": {"content": [{"endIndex": 11}]}})
+
+        mock_post.return_value = _json_response(200, {"replies": [{}, {}, {}]})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        with patch("httpx.AsyncClient.get", new=fake_get):
+            await asyncio.gather(
+                client.insert_text("doc123", "AAAA"),
+                client.insert_text("doc123", "BB"),
+                client.insert_text("doc123", "C"),
+            )
+
+        mock_post.assert_called_once()
+        sent = [r["insertText"] for r in _sent_json(mock_post.call_args)["requests"]]
+        assert [(r["location"]["index"], r["text"]) for r in sent] == [
+            (10, "AAAA"),
+            (14, "BB"),
+            (16, "C"),
+        ]
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_batch_update_flushes_queued_requests_first(self, mock_post):
+        """Test that an explicit batch update is sent after earlier queued updates."""
+        mock_response = _json_response(200, {"replies": [{}]})
+        mock_post.return_value = mock_response
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        queued = asyncio.create_task(client.format_text("doc123", 1, 5, bold=True))
+        await asyncio.sleep(0)
+        await client.batch_update("doc123", [{"deleteContentRange": {}}])
+        await queued
+
+        sent = [_sent_json(c)["requests"] for c in mock_post.call_args_list]
+        assert [next(iter(r[0])) for r in sent] == ["updateTextStyle", "deleteContentRange"]
+
+
+def _streaming_response(status_code: int, body: bytes = b""):
+    """Build a stand-in for httpx.AsyncClient.stream returning the given body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.aread = AsyncMock(return_value=body)
+
+    async def aiter_bytes(chunk_size=None):
+        step = chunk_size or len(body) or 1
+        for start in range(0, len(body), step):
+            yield body[start : start + step]
+
+    response.aiter_bytes = aiter_bytes
+
+    @asynccontextmanager
+    async def stream(*args, **kwargs):
+        yield response
+
+    return stream
+
+
 class TestGoogleDocsExport:
     """Tests for google_docs_export_content tool."""
 
-    @patch("httpx.get")
-    def test_export_to_pdf(self, mock_get, mcp_with_credentials):
+    async def test_export_to_pdf(self, mcp_with_credentials):
         """Test exporting document to PDF."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b"PDF content here"
-        mock_get.return_value = mock_response
-
-        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_export_content")
-        result = tool_fn(document_id="doc123", format="pdf")
+        with patch("httpx.AsyncClient.stream", _streaming_response(200, b"PDF content here")):
+            tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_export_content")
+            result = await tool_fn(document_id="doc123", format="pdf")
 
         assert result["document_id"] == "doc123"
         assert result["mime_type"] == "application/pdf"
         assert "content_base64" in result
         assert result["size_bytes"] == len(b"PDF content here")
 
-    @patch("httpx.get")
-    def test_export_to_docx(self, mock_get, mcp_with_credentials):
+    async def test_export_to_docx(self, mcp_with_credentials):
         """Test exporting document to DOCX."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b"DOCX content"
-        mock_get.return_value = mock_response
-
-        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_export_content")
-        result = tool_fn(document_id="doc123", format="docx")
+        with patch("httpx.AsyncClient.stream", _streaming_response(200, b"DOCX content")):
+            tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_export_content")
+            result = await tool_fn(document_id="doc123", format="docx")
 
         assert "application/vnd.openxmlformats" in result["mime_type"]
 
+    async def test_export_encodes_across_chunk_boundaries(self):
+        """Test that chunked encoding matches encoding the whole file at once."""
+        body = bytes(range(256)) * 1000 + b"tail"
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        with (
+            patch("httpx.AsyncClient.stream", _streaming_response(200, body)),
+            patch.object(google_docs_tool, "_EXPORT_CHUNK_SIZE", 1000),
+        ):
+            result = await client.export_document("doc123")
+
+        assert base64.b64decode(result["content_base64"]) == body
+        assert result["size_bytes"] == len(body)
+
+    async def test_export_raw_skips_base64(self):
+        """Test that raw encoding returns the exported bytes directly."""
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        with patch("httpx.AsyncClient.stream", _streaming_response(200, b"plain text")):
+            result = await client.export_document("doc123", "text/plain", encoding="raw")
+
+        assert result["content_bytes"] == b"plain text"
+        assert "content_base64" not in result
+
+    async def test_export_not_found(self, mcp_with_credentials):
+        """Test handling of 404 for an export."""
+        with patch("httpx.AsyncClient.stream", _streaming_response(404)):
+            tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_export_content")
+            result = await tool_fn(document_id="nonexistent")
+
+        assert "not found" in result["error"].lower()
+
 
 class TestGoogleDocsCreateList:
     """Tests for google_docs_create_list tool."""
 
-    @patch("httpx.post")
-    def test_create_bullet_list(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_create_bullet_list(self, mock_post, mcp_with_credentials):
         """Test creating a bullet list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"replies": []}
+        mock_response = _json_response(200, {"replies": []})
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_create_list")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             start_index=1,
             end_index=50,
@@ -317,16 +777,14 @@ def test_create_bullet_list(self, mock_post, mcp_with_credentials):
 
         assert "error" not in result
 
-    @patch("httpx.post")
-    def test_create_numbered_list(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_create_numbered_list(self, mock_post, mcp_with_credentials):
         """Test creating a numbered list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"replies": []}
+        mock_response = _json_response(200, {"replies": []})
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_create_list")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             start_index=1,
             end_index=50,
@@ -339,19 +797,20 @@ def test_create_numbered_list(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsAddComment:
     """Tests for google_docs_add_comment tool."""
 
-    @patch("httpx.post")
-    def test_add_comment_success(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_add_comment_success(self, mock_post, mcp_with_credentials):
         """Test adding a comment to a document."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "comment123",
-            "content": "This needs review",
-        }
+        mock_response = _json_response(
+            200,
+            {
+                "id": "comment123",
+                "content": "This needs review",
+            },
+        )
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_add_comment")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             content="This needs review",
         )
@@ -363,16 +822,14 @@ def test_add_comment_success(self, mock_post, mcp_with_credentials):
 class TestImageUriValidation:
     """Tests for image URI validation."""
 
-    @patch("httpx.post")
-    def test_insert_image_valid_https_uri(self, mock_post, mcp_with_credentials):
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_insert_image_valid_https_uri(self, mock_post, mcp_with_credentials):
         """Test that valid HTTPS URIs are accepted."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"replies": []}
+        mock_response = _json_response(200, {"replies": []})
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_image")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             image_uri="https://example.com/image.png",
             index=1,
@@ -380,10 +837,10 @@ def test_insert_image_valid_https_uri(self, mock_post, mcp_with_credentials):
 
         assert "error" not in result
 
-    def test_insert_image_empty_uri(self, mcp_with_credentials):
+    async def test_insert_image_empty_uri(self, mcp_with_credentials):
         """Test that empty URI returns an error."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_image")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             image_uri="",
             index=1,
@@ -392,10 +849,10 @@ def test_insert_image_empty_uri(self, mcp_with_credentials):
         assert "error" in result
         assert "empty" in result["error"].lower()
 
-    def test_insert_image_invalid_scheme(self, mcp_with_credentials):
+    async def test_insert_image_invalid_scheme(self, mcp_with_credentials):
         """Test that non-http(s) schemes are rejected."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_image")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             image_uri="ftp://example.com/image.png",
             index=1,
@@ -404,10 +861,10 @@ def test_insert_image_invalid_scheme(self, mcp_with_credentials):
         assert "error" in result
         assert "scheme" in result["error"].lower()
 
-    def test_insert_image_missing_scheme(self, mcp_with_credentials):
+    async def test_insert_image_missing_scheme(self, mcp_with_credentials):
         """Test that URIs without scheme are rejected."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_image")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             image_uri="example.com/image.png",
             index=1,
@@ -416,10 +873,10 @@ def test_insert_image_missing_scheme(self, mcp_with_credentials):
         assert "error" in result
         assert "scheme" in result["error"].lower() or "format" in result["error"].lower()
 
-    def test_insert_image_javascript_uri_rejected(self, mcp_with_credentials):
+    async def test_insert_image_javascript_uri_rejected(self, mcp_with_credentials):
         """Test that javascript: URIs are rejected."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_image")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             image_uri="javascript:alert('xss')",
             index=1,
@@ -431,10 +888,10 @@ def test_insert_image_javascript_uri_rejected(self, mcp_with_credentials):
 class TestReplaceAllTextValidation:
     """Tests for replace_all_text validation."""
 
-    def test_replace_all_text_empty_find_text(self, mcp_with_credentials):
+    async def test_replace_all_text_empty_find_text(self, mcp_with_credentials):
         """Test that empty find_text returns an error."""
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_replace_all_text")
-        result = tool_fn(
+        result = await tool_fn(
             document_id="doc123",
             find_text="",
             replace_text="replacement",
@@ -447,62 +904,336 @@ def test_replace_all_text_empty_find_text(self, mcp_with_credentials):
 class TestServiceAccountTokenExchange:
     """Tests for service account JWT token exchange."""
 
-    @patch("httpx.post")
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
     @patch.dict(
         "os.environ",
         {"GOOGLE_SERVICE_ACCOUNT_JSON": '{"access_token": "pre-exchanged-token"}'},
     )
-    def test_fallback_to_pre_exchanged_token(self, mock_post):
+    async def test_fallback_to_pre_exchanged_token(self, mock_post):
         """Test that pre-exchanged tokens in JSON are used as fallback."""
         server = FastMCP("test")
         register_tools(server)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "documentId": "doc123",
-            "title": "Test",
-        }
+        mock_response = _json_response(
+            200,
+            {
+                "documentId": "doc123",
+                "title": "Test",
+            },
+        )
         mock_post.return_value = mock_response
 
         tool_fn = get_tool_fn(server, "google_docs_create_document")
-        result = tool_fn(title="Test")
+        result = await tool_fn(title="Test")
 
         # Should use the pre-exchanged token and make the API call
         assert "error" not in result or "not configured" not in result.get("error", "")
 
 
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+class TestTokenCache:
+    """Tests for the per-account access token cache."""
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_token_looked_up_once_across_calls(self, mock_post):
+        """Test that the credential store is only consulted on the first call."""
+        mock_response = _json_response(200, {"documentId": "doc123"})
+        mock_post.return_value = mock_response
+
+        server = FastMCP("test")
+        credentials = MagicMock()
+        credentials.get.return_value = "test-access-token"
+        register_tools(server, credentials=credentials)
+        tool_fn = get_tool_fn(server, "google_docs_create_document")
+
+        await tool_fn(title="One")
+        await tool_fn(title="Two")
+
+        credentials.get.assert_called_once_with("google_docs")
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == (
+            "Bearer test-access-token"
+        )
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_near_expiry_jwt_is_not_cached(self, mock_post):
+        """Test that a JWT about to expire is looked up again on the next call."""
+        mock_response = _json_response(200, {"documentId": "doc123"})
+        mock_post.return_value = mock_response
+
+        server = FastMCP("test")
+        credentials = MagicMock()
+        credentials.get.return_value = _jwt(time.time() + 5)
+        register_tools(server, credentials=credentials)
+        tool_fn = get_tool_fn(server, "google_docs_create_document")
+
+        await tool_fn(title="One")
+        await tool_fn(title="Two")
+
+        assert credentials.get.call_count == 2
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_rejected_token_is_replaced_and_retried(self, mock_post):
+        """Test that a 401 drops the cached token and resends with a fresh one."""
+        mock_post.side_effect = [
+            _json_response(401, {}),
+            _json_response(200, {"documentId": "doc123"}),
+            _json_response(200, {"documentId": "doc456"}),
+        ]
+
+        server = FastMCP("test")
+        credentials = MagicMock()
+        credentials.get.side_effect = ["expired", "fresh"]
+        register_tools(server, credentials=credentials)
+        tool_fn = get_tool_fn(server, "google_docs_create_document")
+
+        first = await tool_fn(title="One")
+        second = await tool_fn(title="Two")
+
+        assert first["document_id"] == "doc123"
+        assert second["document_id"] == "doc456"
+        assert credentials.get.call_count == 2
+        sent = [c.kwargs["headers"]["Authorization"] for c in mock_post.call_args_list]
+        assert sent == ["Bearer expired", "Bearer fresh", "Bearer fresh"]
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_rejected_token_not_retried_without_a_new_one(self, mock_post):
+        """Test that a 401 is returned as is when the lookup gives the same token."""
+        mock_post.return_value = _json_response(401, {})
+
+        server = FastMCP("test")
+        credentials = MagicMock()
+        credentials.get.return_value = "test-access-token"
+        register_tools(server, credentials=credentials)
+        tool_fn = get_tool_fn(server, "google_docs_create_document")
+
+        result = await tool_fn(title="One")
+
+        mock_post.assert_called_once()
+        assert "Invalid or expired" in result["error"]
+
+    async def test_missing_token_is_not_cached(self, mcp):
+        """Test that configuring a token after a failed lookup takes effect."""
+        tool_fn = get_tool_fn(mcp, "google_docs_create_document")
+        with patch.dict("os.environ", {}, clear=True):
+            result = await tool_fn(title="Test")
+        assert "not configured" in result["error"]
+
+        with (
+            patch.dict("os.environ", {"GOOGLE_DOCS_ACCESS_TOKEN": "late-token"}, clear=True),
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+        ):
+            mock_post.return_value = _json_response(200, {"documentId": "doc123"})
+            result = await tool_fn(title="Test")
+        assert result["document_id"] == "doc123"
+
+
 class TestGoogleDocsListComments:
     """Tests for google_docs_list_comments tool."""
 
-    @patch("httpx.get")
-    def test_list_comments_success(self, mock_get, mcp_with_credentials):
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_list_comments_success(self, mock_get, mcp_with_credentials):
         """Test retrieving comments with pagination token."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "comments": [{"id": "comment123", "content": "Looks good"}],
-            "nextPageToken": "next-token",
-        }
+        mock_response = _json_response(
+            200,
+            {
+                "comments": [{"id": "comment123", "content": "Looks good"}],
+                "nextPageToken": "next-token",
+            },
+        )
         mock_get.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_list_comments")
-        result = tool_fn(document_id="doc123", page_size=10)
+        result = await tool_fn(document_id="doc123", page_size=10)
 
         assert result["document_id"] == "doc123"
         assert len(result["comments"]) == 1
         assert result["comments"][0]["id"] == "comment123"
         assert result["next_page_token"] == "next-token"
 
-    @patch("httpx.get")
-    def test_list_comments_not_found(self, mock_get, mcp_with_credentials):
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_list_comments_not_found(self, mock_get, mcp_with_credentials):
         """Test handling a missing document for comment retrieval."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
+        mock_response = _json_response(404)
         mock_get.return_value = mock_response
 
         tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_list_comments")
-        result = tool_fn(document_id="does-not-exist")
+        result = await tool_fn(document_id="does-not-exist")
 
         assert "error" in result
         assert "not found" in result["error"].lower()
+
+
+class TestRetry:
+    """Tests for retrying rate limits and transient server errors."""
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_retries_until_success_honoring_retry_after(self, mock_get, mock_sleep):
+        """Test that 429/5xx responses are retried and Retry-After is respected."""
+        mock_get.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(503),
+            _json_response(200, {"documentId": "doc123"}),
+        ]
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        result = await client.get_document("doc123")
+
+        assert result == {"documentId": "doc123"}
+        assert mock_get.call_count == 3
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays[0] == 3.0
+        assert 2.0 <= delays[1] <= 2.25
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_gives_up_after_max_attempts(self, mock_get, mock_sleep):
+        """Test that persistent rate limiting is reported after the last attempt."""
+        mock_get.return_value = httpx.Response(429, headers={"Retry-After": "120"})
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        result = await client.get_document("doc123")
+
+        assert "rate limit" in result["error"]
+        assert mock_get.call_count == google_docs_tool._MAX_ATTEMPTS
+        assert all(c.args[0] == 30.0 for c in mock_sleep.call_args_list)
+
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_client_errors_not_retried(self, mock_get):
+        """Test that non-transient errors return immediately."""
+        mock_get.return_value = _json_response(404)
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        result = await client.get_document("doc123")
+
+        assert "not found" in result["error"].lower()
+        mock_get.assert_called_once()
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_write_not_retried_on_server_error(self, mock_post, mock_sleep):
+        """Test that a POST hitting a 5xx that may have applied is not resent."""
+        mock_post.return_value = httpx.Response(502)
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        result = await client.create_document("Report")
+
+        assert "HTTP 502" in result["error"]
+        mock_post.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_write_retried_when_not_processed(self, mock_post, mock_sleep):
+        """Test that a POST is retried on 429 and 503, which apply nothing."""
+        mock_post.side_effect = [
+            httpx.Response(429),
+            httpx.Response(503),
+            _json_response(200, {"documentId": "doc123", "title": "Report"}),
+        ]
+
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        result = await client.create_document("Report")
+
+        assert result["documentId"] == "doc123"
+        assert mock_post.call_count == 3
+
+    async def test_batch_updates_spaced_per_document(self):
+        """Test that back-to-back batchUpdates for one document wait for their slot."""
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await google_docs_tool._GoogleDocsClient._wait_for_batch_slot("doc1")
+            await google_docs_tool._GoogleDocsClient._wait_for_batch_slot("doc2")
+            mock_sleep.assert_not_called()
+            await google_docs_tool._GoogleDocsClient._wait_for_batch_slot("doc1")
+
+        (delay,) = mock_sleep.call_args.args
+        assert 0 < delay <= google_docs_tool._BATCH_UPDATE_INTERVAL_SECONDS
+
+
+class TestClientReuse:
+    """Tests for reusing clients across tool calls."""
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_cached_end_index_survives_between_tool_calls(
+        self, mock_get, mock_post, mcp_with_credentials
+    ):
+        """Test that consecutive appends through the tool share one client's cache."""
+        mock_get.return_value = _json_response(200, {"body": {"content": [{"endIndex": 100}]}})
+        mock_post.return_value = _json_response(200, {"replies": [{}]})
+
+        tool_fn = get_tool_fn(mcp_with_credentials, "google_docs_insert_text")
+        await tool_fn(document_id="doc123", text="Hello")
+        await tool_fn(document_id="doc123", text="World")
+
+        mock_get.assert_called_once()
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_rotated_token_gets_new_client(self, mock_post):
+        """Test that a new token is not served by the previous token's client."""
+        mock_post.return_value = _json_response(200, {"documentId": "doc123"})
+        server = FastMCP("test")
+        credentials = MagicMock()
+        credentials.get.side_effect = [_jwt(time.time() + 5), "second-token"]
+        register_tools(server, credentials=credentials)
+        tool_fn = get_tool_fn(server, "google_docs_create_document")
+
+        await tool_fn(title="One")
+        await tool_fn(title="Two")
+
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer second-token"
+
+
+class TestDocumentUrls:
+    """Tests for the per-document URL cache."""
+
+    def test_urls_built_once_per_document(self):
+        """Test that endpoint URLs are cached and point at the right APIs."""
+        client = google_docs_tool._GoogleDocsClient("test-access-token")
+        urls = client._urls_for("doc123")
+
+        assert client._urls_for("doc123") is urls
+        assert urls.document == "https://docs.googleapis.com/v1/documents/doc123"
+        assert urls.batch_update == urls.document + ":batchUpdate"
+        assert urls.comments == "https://www.googleapis.com/drive/v3/files/doc123/comments"
+        assert urls.export == "https://www.googleapis.com/drive/v3/files/doc123/export"
+
+
+class TestClientHeaders:
+    """Tests for the precomputed request headers."""
+
+    @patch("httpx.AsyncClient.post", new_callable=AsyncMock)
+    async def test_set_token_rebuilds_headers(self, mock_post):
+        """Test that rotating the token updates the headers sent on later calls."""
+        mock_response = _json_response(200, {"documentId": "doc123"})
+        mock_post.return_value = mock_response
+
+        client = google_docs_tool._GoogleDocsClient("old-token")
+        headers = client._headers
+        client.set_token("new-token")
+        await client.create_document("Test")
+
+        assert headers["Authorization"] == "Bearer old-token"
+        assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Bearer new-token"
+
+
+class TestSharedHttpClient:
+    """Tests for the shared async HTTP client."""
+
+    async def test_client_is_reused_across_calls(self):
+        """Test that the pooled client is created once and reused."""
+        first = google_docs_tool._get_http()
+        assert google_docs_tool._get_http() is first
+        await google_docs_tool.close_http_client()
+        assert google_docs_tool._get_http() is not first
+
+    def test_register_tools_leaves_server_lifespan_alone(self):
+        """Test that registering the tools does not patch the server's lifespan."""
+        server = FastMCP("test")
+        lifespan = getattr(server, "_lifespan", None)
+        register_tools(server)
+        assert getattr(server, "_lifespan", None) is lifespan
@@ -266,7 +266,7 @@ def test_default_values(self):
         spec = CredentialSpec(env_var="TEST_VAR")
 
         assert spec.env_var == "TEST_VAR"
-        assert spec.tools == []
+        assert spec.tools == ()
         assert spec.node_types == []
         assert spec.required is True
         assert spec.startup_required is False
@@ -286,7 +286,7 @@ def test_all_values(self):
         )
 
         assert spec.env_var == "API_KEY"
-        assert spec.tools == ["tool_a", "tool_b"]
+        assert spec.tools == ("tool_a", "tool_b")
         assert spec.node_types == ["event_loop"]
         assert spec.required is False
         assert spec.startup_required is True
@@ -314,7 +314,7 @@ def test_anthropic_spec_exists(self):
 
         spec = CREDENTIAL_SPECS["anthropic"]
         assert spec.env_var == "ANTHROPIC_API_KEY"
-        assert spec.tools == []
+        assert spec.tools == ()
         assert "event_loop" in spec.node_types
         assert spec.required is False
         assert spec.startup_required is False
@@ -4,12 +4,14 @@
 
 import httpx
 
+from aden_tools.credentials import health_check
 from aden_tools.credentials.health_check import (
     HEALTH_CHECKERS,
     AnthropicHealthChecker,
     DiscordHealthChecker,
     GitHubHealthChecker,
     GoogleCalendarHealthChecker,
+    GoogleDocsHealthChecker,
     GoogleMapsHealthChecker,
     GoogleSearchHealthChecker,
     ResendHealthChecker,
@@ -69,6 +71,7 @@ def test_all_expected_checkers_registered(self):
             "google",
             "slack",
             "discord",
+            "google_docs",
         }
         assert set(HEALTH_CHECKERS.keys()) == expected
 
@@ -431,6 +434,123 @@ def test_google_search_without_cse_id(self):
         assert result.details.get("partial_check") is True
 
 
+class TestGoogleDocsHealthChecker:
+    """Tests for GoogleDocsHealthChecker."""
+
+    def _mock_response(self, status_code):
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = status_code
+        return response
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_not_found_probe_means_valid(self, mock_client_cls):
+        """A 404 for the placeholder document proves the token authenticated."""
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client.get.return_value = self._mock_response(404)
+
+        result = GoogleDocsHealthChecker().check("test-token")
+
+        assert result.valid is True
+        assert "fields=documentId" in mock_client.get.call_args[0][0]
+        mock_client.get.return_value.json.assert_not_called()
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_unauthorized_is_invalid(self, mock_client_cls):
+        """A 401 still reports an invalid token."""
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client.get.return_value = self._mock_response(401)
+
+        result = GoogleDocsHealthChecker().check("bad-token")
+
+        assert result.valid is False
+        assert result.details["status_code"] == 401
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_fallback_honors_head_method(self, mock_client_cls):
+        """The generic fallback sends HEAD when the spec asks for it."""
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client.head.return_value = self._mock_response(200)
+
+        result = check_credential_health(
+            "some_service",
+            "test-token",
+            health_check_endpoint="https://api.example.com/ping",
+            health_check_method="HEAD",
+        )
+
+        assert result.valid is True
+        mock_client.head.assert_called_once()
+        mock_client.get.assert_not_called()
+        mock_client.head.return_value.json.assert_not_called()
+
+
+class TestHealthCheckCache:
+    """Tests for TTL caching of health check results."""
+
+    def setup_method(self):
+        health_check._HEALTH_CACHE.clear()
+
+    def _mock_client(self, mock_client_cls, status_code=200):
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = status_code
+        mock_client.get.return_value = response
+        return mock_client
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_result_reused_within_ttl(self, mock_client_cls):
+        """Repeated checks for one credential and endpoint make a single request."""
+        mock_client = self._mock_client(mock_client_cls)
+
+        first = check_credential_health("brave_search", "test-key", health_check_ttl_seconds=30)
+        second = check_credential_health("brave_search", "test-key", health_check_ttl_seconds=30)
+
+        assert first is second
+        mock_client.get.assert_called_once()
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_different_values_not_shared(self, mock_client_cls):
+        """A rotated credential value is checked again."""
+        mock_client = self._mock_client(mock_client_cls)
+
+        check_credential_health("brave_search", "old-key", health_check_ttl_seconds=30)
+        check_credential_health("brave_search", "new-key", health_check_ttl_seconds=30)
+
+        assert mock_client.get.call_count == 2
+        assert not any("new-key" in str(key) for key in health_check._HEALTH_CACHE)
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_no_caching_by_default(self, mock_client_cls):
+        """Without a TTL every call performs the check."""
+        mock_client = self._mock_client(mock_client_cls)
+
+        check_credential_health("brave_search", "test-key")
+        check_credential_health("brave_search", "test-key")
+
+        assert mock_client.get.call_count == 2
+        assert not health_check._HEALTH_CACHE
+
+    @patch("aden_tools.credentials.health_check.httpx.Client")
+    def test_transient_failures_not_cached(self, mock_client_cls):
+        """Timeouts are retried on the next check instead of being remembered."""
+        mock_client = self._mock_client(mock_client_cls)
+        mock_client.get.side_effect = httpx.TimeoutException("slow")
+
+        first = check_credential_health("brave_search", "test-key", health_check_ttl_seconds=30)
+        check_credential_health("brave_search", "test-key", health_check_ttl_seconds=30)
+
+        assert first.valid is False
+        assert mock_client.get.call_count == 2
+
+
 class TestGoogleCalendarHealthCheckerTokenSanitization:
     """Tests for token sanitization in GoogleCalendarHealthChecker error handling."""
 